@@ -99,14 +99,20 @@ import os
 import sys
 import re
 import base64
+import io
 import shutil
+import hashlib
+import importlib.util
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from datetime import datetime
 from far_comms.models.requests import ResearchRequest, ResearchAnalysisOutput
-from far_comms.utils.content_preprocessor import extract_pdf
 from far_comms.utils.json_repair import json_repair
-from anthropic import Anthropic
-import fitz  # PyMuPDF
+# fitz (PyMuPDF), anthropic and pymupdf4llm are imported where used to keep module import fast;
+# content_preprocessor is not imported at all since it pulls in langchain_community at load time
 
 # Load environment variables
 try:
@@ -116,70 +122,242 @@ except ImportError:
     # dotenv not available, skip
     pass
 
-# Try importing PyMuPDF4LLM for better markdown extraction
+logger = logging.getLogger(__name__)
+
+# Try importing orjson for faster JSON output and parsing (json module is the fallback)
 try:
-    import pymupdf4llm
-    PYMUPDF4LLM_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PYMUPDF4LLM_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Check for PyMuPDF4LLM (better markdown extraction) without importing it
+PYMUPDF4LLM_AVAILABLE = importlib.util.find_spec("pymupdf4llm") is not None
+if not PYMUPDF4LLM_AVAILABLE:
     logger.warning("PyMuPDF4LLM not available, falling back to standard extraction")
 
-logger = logging.getLogger(__name__)
+# Optional faster plain-text backend for pdf.txt: RESEARCH_TEXT_BACKEND=pdfium uses pypdfium2 instead of PyMuPDF
+_PDFIUM_TEXT = os.getenv('RESEARCH_TEXT_BACKEND', '').lower() == 'pdfium'
+if _PDFIUM_TEXT and importlib.util.find_spec("pypdfium2") is None:
+    logger.warning("RESEARCH_TEXT_BACKEND=pdfium but pypdfium2 not available, using PyMuPDF text extraction")
+    _PDFIUM_TEXT = False
+
+# Below this many pages, process-pool startup costs more than parallel extraction saves
+_PARALLEL_PAGE_THRESHOLD = 20
+# Each worker process gets at least this many pages, so mid-size papers use a few workers and only long ones use every CPU
+_MIN_PAGES_PER_WORKER = 10
+
+# One extracted figure; field names match the keys written to pdf.json
+FigureRecord = namedtuple('FigureRecord', 'page figure_index filename path format size_bytes')
+
+# Opus 4.1 for PhD-level technical analysis; part of the analysis cache key
+_ANALYSIS_MODEL = "claude-opus-4-1-20250805"
+# Haiku for the cheaper text-structure cleanup; part of the cleanup cache key
+_CLEANUP_MODEL = "claude-3-5-haiku-20241022"
+# Concurrent per-section cleanup requests (kept low to stay under API rate limits)
+_SECTION_LLM_WORKERS = 5
+# Paper content beyond this many characters (~100K tokens) is cut from the analysis prompt
+_MAX_ANALYSIS_CHARS = 400_000
+
+# Bump when the structure of _extract_pdf_metadata_and_content's result changes
+_EXTRACT_CACHE_VERSION = 5
+# Most recently used entries kept on disk per cache kind (extract/cleanup/analysis); older ones are pruned
+_CACHE_MAX_ENTRIES = 64
+# RESEARCH_REFRESH_CACHE=1 ignores cached extractions and LLM responses (fresh results still overwrite the cache)
+_REFRESH_CACHE = os.getenv('RESEARCH_REFRESH_CACHE', '').lower() in ('1', 'true', 'yes')
+
+# Precompiled patterns for the per-line scans below (avoids re-module cache lookups per call)
+# Multiline patterns locate a whole line inside the full text; [^\S\n] is whitespace that stays on the line
+_END_MARKERS_RE = re.compile(
+    r'^[^\S\n]*(?:references|bibliography|appendix(?:[^\S\n]+[a-z])?|acknowledge?ments?|'
+    r'supplement(?:ary|al)[^\S\n]+materials?)[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+# Exact heading words that start the references section for _find_references_start (narrower than
+# _END_MARKERS_RE: no singular acknowledgment, lettered appendix or supplementary material headings)
+_REFERENCES_HEADING_RE = re.compile(
+    r'^[^\S\n]*(?:references|bibliography|appendix|acknowledge?ments)[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+_REF_LIST_START_RE = re.compile(r'^[^\S\n]*(?:\[\d+\][^\S\n]+\w|\d+\.[^\S\n]+\w.*\d{4})', re.MULTILINE)
+# Either of the above, so _filter_main_content finds its cut point in one pass (case folding doesn't affect the list branch)
+_MAIN_CONTENT_END_RE = re.compile(
+    rf'(?P<marker>{_END_MARKERS_RE.pattern})|(?P<refs>{_REF_LIST_START_RE.pattern})',
+    re.IGNORECASE | re.MULTILINE
+)
+_FIRST_REF_RE = re.compile(r'^[^\S\n]*(?:\[1\]|1\..*\d{4})', re.MULTILINE)
+_REF_ENTRY_RE = re.compile(r'^\[\d+\]|\^\d+\.')
+_NUMBERED_REF_RE = re.compile(r'^\[\d+\]|^\d+\..*\d{4}')
+# Figure/table references and common visual indicators (algorithm, flowchart, plot, ...)
+_FIG_OR_TABLE_RE = re.compile(
+    r'\bfig\.?\s*\d+|\bfigure\s+\d+|\btable\s+\d+|\btab\.?\s*\d+|\bdiagram\s+\d+|'
+    r'see\s+figure|shown\s+in\s+figure|as\s+illustrated|'
+    r'algorithm|flowchart|visualization|plot|graph|chart',
+    re.IGNORECASE
+)
+# Whitespace is [^\S\n] so a caption match never runs onto the next line
+_FIG_CAPTION_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'Figure[^\S\n]+(\d+)[:\.]?[^\S\n]*(.+)'  # "Figure 1: Caption text"
+    r'|Fig\.?[^\S\n]*(\d+)[:\.]?[^\S\n]*(.+)'  # "Fig. 1: Caption text"
+    r'|(\d+)\.[^\S\n]*Figure[^\S\n]*[:\.]?[^\S\n]*(.+)'  # "1. Figure: Caption text"
+    r')',
+    re.IGNORECASE | re.MULTILINE
+)
+# Leading punctuation/whitespace or a trailing period, removed from captions in one substitution
+_CAPTION_TRIM_RE = re.compile(r'^[:\-\.\s]+|\s*\.$')
+_NUMBERED_SECTION_RE = re.compile(r'^\d+\.?\s+[A-Z][a-zA-Z\s]+$')
+_DIGITS_RE = re.compile(r'\d+')
+_DIGIT_TABLE = str.maketrans('', '', '0123456789')
+# arXiv identifiers and numbered affiliation lines (e.g. "1University of ...", "2FAR.AI"), matched at line start
+_METADATA_LINE_RE = re.compile(r'arXiv:|\d+(?:[A-Za-z,\s]+(?:University|Institute|AI|MIT|Vector)|FAR\.AI)')
+_INSTITUTION_WORD_RE = re.compile(r'university|institute|arxiv')
+_NUMBERED_AFFILIATION_RE = re.compile(r'^\d+[A-Za-z]')
+_AUTHOR_LINE_RE = re.compile(r'^[A-Za-z\s,.-]+\d+')
+# A comma run (with any surrounding whitespace), e.g. " , ," left behind after stripping affiliation numbers
+_COMMA_RUN_RE = re.compile(r'\s*,(?:\s*,)*\s*')
+_CAMEL_JOIN_RE = re.compile(r'([a-z])([A-Z])')
+_SENTENCE_JOIN_RE = re.compile(r'([a-z])\.([A-Z])')
+_MD_HEADING_PREFIX_RE = re.compile(r'^#+\s*')
+# Section number is "1", "1.", "2.1" or "2.1."; written so a long digit run can't backtrack quadratically
+_NUMBERED_HEADER_RE = re.compile(r'^\*{0,2}(\d+(?:\.\d*)?\.?)\s+([A-Z][a-zA-Z\s]+)\*{0,2}$')
+# Section titles where the main content ends (or that are evaluation artifacts), matched on lowercased titles
+_STOP_SECTION_RE = re.compile('|'.join(re.escape(word) for word in (
+    'reference', 'bibliography', 'appendix', 'acknowledgment', 'acknowledgement',
+    'scores', 'overall_reasoning', 'reasoning about', 'question 1', 'question 2', 'question 3'
+)))
+# Section title keyword -> metadata summary bucket, checked in order (first match wins)
+_SECTION_BUCKET_KEYS = (
+    ('abstract', 'abstract'), ('introduction', 'introduction'),
+    ('method', 'methods'), ('approach', 'methods'), ('design', 'methods'),
+    ('result', 'results'), ('conclusion', 'conclusion'), ('discussion', 'conclusion'),
+)
+# Markdown emphasis markers or bracketed reference numbers like [1,2] in PyMuPDF4LLM author lines
+_AUTHOR_NOISE_RE = re.compile(r'_\*\*|\*\*_|\*\*|_|\[\d+,?\d*,?\d*,?\d*\]')
+_BOLD_NUMBERED_SECTION_RE = re.compile(r'^\*\*(\d+\.)\s+([A-Z][a-zA-Z\s]+)\*\*$')
+_ABSTRACT_OPENING = '**persuasion is a powerful capability'
+_REFERENCES_WORD_RE = re.compile(r'references?|bibliography')
+# Two or more blank (whitespace-only) lines; each repetition ends at a newline, so no \s* overlap to backtrack over
+_EXTRA_BLANK_LINES_RE = re.compile(r'\n(?:[^\S\n]*\n){2,}')
+_UNSAFE_PATH_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_NON_NAME_CHARS_RE = re.compile(r'[^\w\s\-_\.]')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+# Stripped text between sentence punctuation, at least 20 chars (shorter fragments are never matched)
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]{18,}[^.!?\s]')
+_QUANTITATIVE_RE = re.compile(r'\d+%|\d+\.\d+|\d+ (models?|participants?|cases?)')
+# Phrases marking a sentence as a key point in the distilled version (matched case-insensitively)
+_KEY_INDICATORS = (
+    'we propose', 'we introduce', 'we find', 'we show', 'our results',
+    'this work', 'this paper', 'our approach', 'our method', 'our evaluation',
+    'key finding', 'main contribution', 'primary result', 'significant',
+    'important', 'crucial', 'novel', 'first to', 'unlike previous',
+    'definition', 'define', 'operationalized as', 'measured by', 'framework'
+)
+_KEY_INDICATOR_RE = re.compile('|'.join(re.escape(indicator) for indicator in _KEY_INDICATORS), re.IGNORECASE)
 
-def _filter_main_content(text_content: str) -> str:
+@lru_cache(maxsize=256)
+def _sanitize_dirname(title: str) -> str:
     """
-    Filter PDF content to focus on main paper, excluding bibliography, references, appendix.
+    Turn a paper title into a safe directory name under research/ (max 100 chars).
     """
-    import re
-    
-    # Split into lines for analysis
-    lines = text_content.split('\n')
-    
-    # Common section headers that indicate end of main content
-    end_markers = [
-        r'^\s*references\s*$',
-        r'^\s*bibliography\s*$', 
-        r'^\s*appendix\s*$',
-        r'^\s*appendix\s+[a-z]\s*$',
-        r'^\s*acknowledgments?\s*$',
-        r'^\s*acknowledgements?\s*$',
-        r'^\s*supplementary\s+materials?\s*$',
-        r'^\s*supplemental\s+materials?\s*$'
-    ]
+    sanitized = _UNSAFE_PATH_CHARS_RE.sub('_', title)
+    sanitized = _NON_NAME_CHARS_RE.sub('', sanitized)
+    sanitized = _WHITESPACE_RUN_RE.sub('_', sanitized)
+    return sanitized.strip('_').strip('.')[:100]
+
+@lru_cache(maxsize=None)
+def _research_root() -> Path:
+    """
+    Return output/research/, resolved once per process (callers mkdir with parents=True,
+    so a directory removed while the server runs is recreated on the next write).
+    """
+    from far_comms.utils.project_paths import get_output_dir
     
-    # Find the first line that matches an end marker
-    end_idx = len(lines)
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        for pattern in end_markers:
-            if re.match(pattern, line_lower, re.IGNORECASE):
-                end_idx = i
-                logger.info(f"Filtering content at line {i}: '{line.strip()}'")
-                break
-        if end_idx < len(lines):
+    research_root = get_output_dir() / "research"
+    research_root.mkdir(parents=True, exist_ok=True)
+    return research_root
+
+def _dump_json(obj) -> bytes:
+    """
+    Serialize to 2-space indented UTF-8 JSON bytes, using orjson when available.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def _load_json(data):
+    """
+    Parse JSON from str or bytes, using orjson when available. Raises ValueError on invalid JSON.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _next_lines(text: str, pos: int, count: int, endpos: int = None) -> list[str]:
+    """
+    Return up to count lines of text starting at offset pos, without splitting the whole text.
+    """
+    endpos = len(text) if endpos is None else endpos
+    end = pos
+    for _ in range(count):
+        end = text.find('\n', end, endpos) + 1
+        if not end:
+            end = endpos
             break
+    return text[pos:end].split('\n')[:count]
+
+def _find_references_start(raw_text: str) -> tuple[int, str] | None:
+    """
+    Locate where references/bibliography/appendix begin in a single scan of the text.
+    Returns (offset of that line, what was found) or None if not found.
+    """
+    marker = _REFERENCES_HEADING_RE.search(raw_text)
+    limit = marker.start() if marker else len(raw_text)
+    
+    # A numbered reference list before the first section marker wins
+    for match in _FIRST_REF_RE.finditer(raw_text, 0, limit):
+        following = _next_lines(raw_text, match.start(), 3)
+        if sum(1 for line in following if _NUMBERED_REF_RE.match(line.strip())) >= 2:
+            return match.start(), 'numbered references'
     
-    # Also look for numbered reference lists (e.g., "[1] Author, Title...")
-    for i in range(end_idx):
-        line = lines[i].strip()
-        # Check if we hit a numbered reference list
-        if re.match(r'^\[\d+\]\s+\w+', line) or re.match(r'^\d+\.\s+\w+.*\d{4}', line):
-            # Verify this looks like a reference section by checking next few lines
-            ref_count = 0
-            for j in range(i, min(i+5, end_idx)):
-                if re.match(r'^\[\d+\]|\^\d+\.', lines[j].strip()):
-                    ref_count += 1
-            if ref_count >= 2:  # Multiple numbered references
-                end_idx = i
-                logger.info(f"Found numbered references starting at line {i}")
+    if marker:
+        return marker.start(), marker.group(0).strip()
+    return None
+
+def _filter_main_content(text_content: str) -> str:
+    """
+    Filter PDF content to focus on main paper, excluding bibliography, references, appendix.
+    """
+    # Single pass: stop at the first end-marker line (references, appendix, etc.) or at an
+    # earlier numbered reference list (e.g., "[1] Author, Title...")
+    end_pos = len(text_content)
+    for match in _MAIN_CONTENT_END_RE.finditer(text_content):
+        if match.group('marker'):
+            end_pos = match.start()
+            line_num = text_content.count('\n', 0, end_pos)
+            logger.info(f"Filtering content at line {line_num}: '{match.group(0).strip()}'")
+            break
+        
+        # Verify this looks like a reference section by checking next few lines (up to any end marker)
+        ref_count = 0
+        for line in _next_lines(text_content, match.start(), 5):
+            if _END_MARKERS_RE.match(line):
                 break
+            if _REF_ENTRY_RE.match(line.strip()):
+                ref_count += 1
+        if ref_count >= 2:  # Multiple numbered references
+            end_pos = match.start()
+            line_num = text_content.count('\n', 0, end_pos)
+            logger.info(f"Found numbered references starting at line {line_num}")
+            break
     
-    # Return filtered content
-    main_content = '\n'.join(lines[:end_idx])
+    # Return filtered content (without the newline that ends the last kept line)
+    main_content = text_content[:max(end_pos - 1, 0)] if end_pos < len(text_content) else text_content
     
-    original_words = len(text_content.split())
-    filtered_words = len(main_content.split())
-    logger.info(f"Filtered content: {original_words} → {filtered_words} words ({filtered_words/original_words*100:.1f}% retained)")
+    # Log character counts (O(1)) rather than re-splitting the text
+    retained = len(main_content) / len(text_content) * 100 if text_content else 0
+    logger.info(f"Filtered content: {len(text_content)} → {len(main_content)} chars ({retained:.1f}% retained)")
     
     return main_content
 
@@ -187,102 +365,86 @@ def _has_figures_or_tables(text_content: str) -> bool:
     """
     Check if the paper contains figure or table references that would benefit from visual analysis.
     """
-    import re
-    
-    # Look for common figure/table references
-    figure_patterns = [
-        r'\bfig\.?\s*\d+',
-        r'\bfigure\s+\d+',
-        r'\btable\s+\d+',
-        r'\btab\.?\s*\d+',
-        r'\bplot\s+\d+',
-        r'\bgraph\s+\d+',
-        r'\bchart\s+\d+',
-        r'\bdiagram\s+\d+',
-        r'see\s+figure',
-        r'shown\s+in\s+figure',
-        r'as\s+illustrated',
-        r'algorithm\s+\d+'
-    ]
-    
-    text_lower = text_content.lower()
-    
-    for pattern in figure_patterns:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return True
-    
-    # Also check for common visual indicators
-    visual_keywords = ['algorithm', 'flowchart', 'visualization', 'plot', 'graph', 'chart']
-    for keyword in visual_keywords:
-        if keyword in text_lower:
-            return True
-    
-    return False
+    # One case-insensitive scan that stops at the first figure/table reference or visual keyword
+    return _FIG_OR_TABLE_RE.search(text_content) is not None
 
-def _find_references_page(raw_text: str) -> int:
+def _find_references_page(raw_text: str, raw_text_pages: list[str] = None) -> int:
     """
     Find the page number where references/bibliography starts.
+    With the per-page texts that were joined into raw_text, the exact page is returned; otherwise it is estimated.
     Returns page number (1-indexed) or -1 if not found.
     """
-    lines = raw_text.split('\n')
-    
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        # Look for references section
-        if line_lower in ['references', 'bibliography', 'appendix', 'acknowledgments', 'acknowledgements']:
-            # Estimate page number by counting page breaks or form feeds
-            text_before = '\n'.join(lines[:i])
-            # Rough estimation: ~50 lines per page (adjust based on typical academic papers)
-            estimated_page = max(1, int(len(text_before.split('\n')) / 50))
-            logger.info(f"Found '{line.strip()}' section, estimated at page {estimated_page}")
-            return estimated_page
-        # Look for numbered reference lists
-        if re.match(r'^\[1\]', line.strip()) or re.match(r'^1\..*\d{4}', line.strip()):
-            ref_indicators = 0
-            for j in range(i, min(i+3, len(lines))):
-                if re.match(r'^\[\d+\]|^\d+\..*\d{4}', lines[j].strip()):
-                    ref_indicators += 1
-            if ref_indicators >= 2:
-                text_before = '\n'.join(lines[:i])
-                estimated_page = max(1, int(len(text_before.split('\n')) / 50))
-                logger.info(f"Found numbered references starting at estimated page {estimated_page}")
-                return estimated_page
+    references_start = _find_references_start(raw_text)
+    if references_start:
+        start_pos, section_found = references_start
+        if raw_text_pages:
+            # Pages are joined with '\n\n'; find the page whose span contains the match offset
+            page_starts = [0, *accumulate(len(page) + 2 for page in raw_text_pages[:-1])]
+            page = bisect_right(page_starts, start_pos)
+            logger.info(f"Found '{section_found}' section on page {page}")
+            return page
+        line_idx = raw_text.count('\n', 0, start_pos)
+        # Rough estimation: ~50 lines per page (adjust based on typical academic papers), 1-indexed
+        estimated_page = line_idx // 50 + 1
+        logger.info(f"Found '{section_found}' section, estimated at page {estimated_page}")
+        return estimated_page
     
     logger.info("No references section found")
     return -1
 
-def _extract_figures_from_pdf(pdf_path: str, paper_title: str, max_page: int = None) -> dict:
+def _save_figure_images(doc, figures_dir: Path, jobs: list) -> tuple[list, list]:
+    """
+    Decode and write the images for (page_num, img_index, xref) jobs.
+    Returns (FigureRecords, failures as (page_num, img_index, error) tuples).
+    """
+    figures = []
+    failures = []
+    
+    for page_num, img_index, xref in jobs:
+        try:
+            # Get image data
+            base_image = doc.extract_image(xref)
+            image_bytes = base_image["image"]
+            image_ext = base_image["ext"]
+            
+            # Generate figure filename and save figure
+            figure_name = f"page_{page_num+1:02d}_fig_{img_index+1:02d}.{image_ext}"
+            figure_path = figures_dir / figure_name
+            figure_path.write_bytes(image_bytes)
+            
+            figures.append(FigureRecord(
+                page=page_num + 1,
+                figure_index=img_index + 1,
+                filename=figure_name,
+                path=str(figure_path),
+                format=image_ext,
+                size_bytes=len(image_bytes)
+            ))
+        except Exception as e:
+            failures.append((page_num, img_index, str(e)))
+    
+    return figures, failures
+
+def _extract_figures_from_pdf(doc, pdf_path: str, paper_title: str, max_page: int = None) -> dict:
     """
     Extract and save all figures from PDF pages before references section.
-    Returns dict with figure extraction results.
+    Uses the caller's open document; returns dict with figure extraction results.
     """
     try:
-        doc = fitz.open(pdf_path)
-        
         # Create figures directory under research/{title}/figures/
-        from far_comms.utils.project_paths import get_output_dir
-        base_output_dir = get_output_dir()
-        
-        # Sanitize paper title for directory name
-        def sanitize_dirname(title: str) -> str:
-            sanitized = re.sub(r'[<>:"/\\|?*]', '_', title)
-            sanitized = re.sub(r'[^\w\s\-_\.]', '', sanitized)
-            sanitized = re.sub(r'\s+', '_', sanitized)
-            return sanitized.strip('_').strip('.')[:100]
-        
-        sanitized_title = sanitize_dirname(paper_title or Path(pdf_path).stem)
-        figures_dir = base_output_dir / "research" / sanitized_title / "figures"
+        sanitized_title = _sanitize_dirname(paper_title or Path(pdf_path).stem)
+        figures_dir = _research_root() / sanitized_title / "figures"
         figures_dir.mkdir(parents=True, exist_ok=True)
         
-        # Extract figures from pages (up to max_page if specified)
-        figures_extracted = []
-        total_figures = 0
+        # Collect images from pages (up to max_page if specified)
+        jobs = []
+        seen_xrefs = set()  # Logos/figures reused across pages are saved once
         
         end_page = min(max_page or doc.page_count, doc.page_count)
         
         for page_num in range(end_page):
             page = doc[page_num]
-            images = page.get_images()
+            images = page.get_images(full=False)
             
             if not images:
                 continue
@@ -290,35 +452,29 @@ def _extract_figures_from_pdf(pdf_path: str, paper_title: str, max_page: int = N
             logger.info(f"Extracting {len(images)} figures from page {page_num + 1}")
             
             for img_index, img in enumerate(images):
-                try:
-                    # Get image data
-                    xref = img[0]  # xref number
-                    base_image = doc.extract_image(xref)
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-                    
-                    # Generate figure filename
-                    figure_name = f"page_{page_num+1:02d}_fig_{img_index+1:02d}.{image_ext}"
-                    figure_path = figures_dir / figure_name
-                    
-                    # Save figure
-                    with open(figure_path, 'wb') as f:
-                        f.write(image_bytes)
-                    
-                    figures_extracted.append({
-                        'page': page_num + 1,
-                        'figure_index': img_index + 1,
-                        'filename': figure_name,
-                        'path': str(figure_path),
-                        'format': image_ext,
-                        'size_bytes': len(image_bytes)
-                    })
-                    total_figures += 1
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to extract figure {img_index+1} from page {page_num+1}: {e}")
-        
-        doc.close()
+                xref = img[0]  # xref number
+                if xref in seen_xrefs:
+                    continue
+                seen_xrefs.add(xref)
+                jobs.append((page_num, img_index, xref))
+        
+        # Write the images in-process: extract_image mostly hands back the embedded stream,
+        # so this is byte copying that a process pool (re-opening the PDF per worker) only slows down
+        figures_extracted, failures = _save_figure_images(doc, figures_dir, jobs)
+        
+        for page_num, img_index, error in failures:
+            logger.warning(f"Failed to extract figure {img_index+1} from page {page_num+1}: {error}")
+        
+        total_figures = len(figures_extracted)
+        
+        # Optionally bundle all figures into one uncompressed figures.zip (images are already compressed)
+        if figures_extracted and os.getenv('RESEARCH_FIGURES_ZIP', '').lower() in ('1', 'true', 'yes'):
+            import zipfile
+            zip_path = figures_dir / "figures.zip"
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as figures_zip:
+                for fig in figures_extracted:
+                    figures_zip.write(fig.path, fig.filename)
+            logger.info(f"Bundled {total_figures} figures into {zip_path}")
         
         logger.info(f"Extracted {total_figures} figures to {figures_dir}")
         
@@ -338,22 +494,122 @@ def _extract_figures_from_pdf(pdf_path: str, paper_title: str, max_page: int = N
             'figures_extracted': []
         }
 
-def _extract_pdf_metadata_and_content(pdf_path: str) -> dict:
+def _extract_pages(doc, start: int, end: int, include_structured: bool = False) -> dict:
+    """
+    Extract reading-order text, visual content counts and (if requested) structured blocks for pages [start, end).
+    Each page is loaded once and everything is taken from it.
+    """
+    structured_content = []
+    raw_text_pages = []
+    pages_with_images = []
+    pages_with_drawings = []
+    
+    for page_num, page in enumerate(doc.pages(start, end), start):
+        # The 'dict' tree (every span with font/bbox) is the costliest extraction, so it is opt-in
+        if include_structured:
+            try:
+                page_dict = page.get_text('dict')
+                structured_content.append({
+                    'page': page_num + 1,
+                    'blocks': page_dict.get('blocks', []),
+                    'width': page_dict.get('width', 0),
+                    'height': page_dict.get('height', 0)
+                })
+            except Exception as e:
+                logger.warning(f"Failed to extract structured content from page {page_num + 1}: {e}")
+                structured_content.append({'page': page_num + 1, 'blocks': [], 'error': str(e)})
+        
+        # Raw text in natural reading order (top-left to bottom-right), unless pypdfium2 provides it
+        if not _PDFIUM_TEXT:
+            raw_text_pages.append(page.get_text(sort=True))
+        
+        images = page.get_images()
+        drawings = page.get_drawings()
+        
+        if images:
+            pages_with_images.append({'page': page_num + 1, 'count': len(images)})
+        
+        if drawings:
+            pages_with_drawings.append({'page': page_num + 1, 'count': len(drawings)})
+    
+    return {
+        'structured_content': structured_content,
+        'raw_text_pages': raw_text_pages,
+        'pages_with_images': pages_with_images,
+        'pages_with_drawings': pages_with_drawings
+    }
+
+def _extract_page_range(pdf_path: str, start: int, end: int, include_structured: bool = False) -> dict:
     """
-    Extract comprehensive PDF metadata, content, and structure using PyMuPDF.
-    Returns dict with metadata, raw text, structured content, and visual content info.
+    Process-pool worker: open a private document handle and extract pages [start, end).
     """
+    import fitz  # PyMuPDF
     doc = fitz.open(pdf_path)
+    try:
+        return _extract_pages(doc, start, end, include_structured)
+    finally:
+        doc.close()
+
+def _extract_pages_parallel(pdf_path: str, page_count: int, include_structured: bool = False) -> dict:
+    """
+    Extract all pages using a process pool over contiguous page ranges, merged in page order.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    
+    workers = max(1, min(os.cpu_count() or 1, page_count // _MIN_PAGES_PER_WORKER))
+    step = -(-page_count // workers)  # ceil division
+    ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+    logger.info(f"Extracting {page_count} pages in parallel across {len(ranges)} processes")
+    
+    merged = {'structured_content': [], 'raw_text_pages': [], 'pages_with_images': [], 'pages_with_drawings': []}
+    # Spawn fresh interpreters: forking the multi-threaded server process can deadlock on locks held by other threads
+    with ProcessPoolExecutor(max_workers=len(ranges), mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = [executor.submit(_extract_page_range, pdf_path, start, end, include_structured)
+                   for start, end in ranges]
+        for future in futures:
+            result = future.result()
+            for key in merged:
+                merged[key].extend(result[key])
+    
+    return merged
+
+def _extract_raw_text_pages_pdfium(pdf_path: str) -> list[str]:
+    """
+    Plain text for every page using pypdfium2, which is faster than PyMuPDF for text-only extraction.
+    """
+    import pypdfium2 as pdfium
     
-    # Extract PDF metadata
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        raw_text_pages = []
+        for page_num in range(len(pdf)):
+            page = pdf[page_num]
+            textpage = page.get_textpage()
+            # PDFium separates lines with \r\n; downstream scans expect \n
+            raw_text_pages.append(textpage.get_text_range().replace('\r\n', '\n'))
+            textpage.close()
+            page.close()
+        return raw_text_pages
+    finally:
+        pdf.close()
+
+def _extract_pdf_metadata_and_content(doc, pdf_path: str, include_structured: bool = False) -> dict:
+    """
+    Extract comprehensive PDF metadata, content, and structure from the caller's open document.
+    Returns dict with metadata, raw text, and visual content info, plus per-page
+    structured content only when include_structured is set.
+    """
+    # Extract PDF metadata (missing for non-PDF documents)
+    metadata = doc.metadata or {}
     pdf_metadata = {
-        'title': doc.metadata.get('title', ''),
-        'author': doc.metadata.get('author', ''),
-        'subject': doc.metadata.get('subject', ''),
-        'creator': doc.metadata.get('creator', ''),
-        'producer': doc.metadata.get('producer', ''),
-        'creationDate': doc.metadata.get('creationDate', ''),
-        'modDate': doc.metadata.get('modDate', ''),
+        'title': metadata.get('title', ''),
+        'author': metadata.get('author', ''),
+        'subject': metadata.get('subject', ''),
+        'creator': metadata.get('creator', ''),
+        'producer': metadata.get('producer', ''),
+        'creationDate': metadata.get('creationDate', ''),
+        'modDate': metadata.get('modDate', ''),
     }
     
     # Extract document structure
@@ -365,54 +621,28 @@ def _extract_pdf_metadata_and_content(pdf_path: str) -> dict:
         'is_encrypted': doc.is_encrypted,
     }
     
-    # Extract structured content using PyMuPDF's dict format
-    structured_content = []
-    for page_num in range(doc.page_count):
-        page = doc[page_num]
-        try:
-            page_dict = page.get_text('dict')
-            structured_content.append({
-                'page': page_num + 1,
-                'blocks': page_dict.get('blocks', []),
-                'width': page_dict.get('width', 0),
-                'height': page_dict.get('height', 0)
-            })
-        except Exception as e:
-            logger.warning(f"Failed to extract structured content from page {page_num + 1}: {e}")
-            structured_content.append({'page': page_num + 1, 'blocks': [], 'error': str(e)})
+    # Per-page extraction; long papers are split into page ranges across worker processes
+    page_count = doc.page_count
+    if page_count >= _PARALLEL_PAGE_THRESHOLD and (os.cpu_count() or 1) > 1:
+        pages = _extract_pages_parallel(pdf_path, page_count, include_structured)
+    else:
+        pages = _extract_pages(doc, 0, page_count, include_structured)
     
-    # Extract raw text content in natural reading order (top-left to bottom-right)
-    raw_text_pages = []
-    for page_num in range(doc.page_count):
-        page = doc[page_num]
-        page_text = page.get_text(sort=True)  # Sort text from top-left to bottom-right
-        raw_text_pages.append(page_text)
+    raw_text_pages = _extract_raw_text_pages_pdfium(pdf_path) if _PDFIUM_TEXT else pages['raw_text_pages']
+    pages_with_images = pages['pages_with_images']
+    pages_with_drawings = pages['pages_with_drawings']
     
     raw_text = '\n\n'.join(raw_text_pages)
     
-    # Count visual content
-    total_images = 0
-    pages_with_images = []
-    total_drawings = 0
-    pages_with_drawings = []
-    
-    for page_num in range(doc.page_count):
-        page = doc[page_num]
-        images = page.get_images()
-        drawings = page.get_drawings()
-        
-        if images:
-            total_images += len(images)
-            pages_with_images.append({'page': page_num + 1, 'count': len(images)})
-        
-        if drawings:
-            total_drawings += len(drawings)
-            pages_with_drawings.append({'page': page_num + 1, 'count': len(drawings)})
+    # Located here, while page boundaries are known, so figure extraction can stop at that page
+    references_page = _find_references_page(raw_text, raw_text_pages)
+    # Main-body text for the Claude analysis, filtered once here so cached extractions skip the rescan
+    main_content = _filter_main_content(raw_text)
     
     visual_content = {
-        'total_images': total_images,
+        'total_images': sum(p['count'] for p in pages_with_images),
         'pages_with_images': pages_with_images,
-        'total_drawings': total_drawings,
+        'total_drawings': sum(p['count'] for p in pages_with_drawings),
         'pages_with_drawings': pages_with_drawings
     }
     
@@ -433,16 +663,16 @@ def _extract_pdf_metadata_and_content(pdf_path: str) -> dict:
                 current_section = 'title'
                 continue
             elif current_section == 'title':
-                if re.search(r'^[A-Za-z\s,.-]+\d+', line):
+                if _AUTHOR_LINE_RE.match(line):
                     current_section = 'authors'
                     author_lines.append(line)
                 else:
                     title_lines.append(line)
             elif current_section == 'authors':
-                if re.search(r'^\d+[A-Za-z]', line):
+                if _NUMBERED_AFFILIATION_RE.match(line):
                     current_section = 'affiliations'
                     affiliation_lines.append(line)
-                elif re.search(r'^[A-Za-z\s,.-]+\d+', line):
+                elif _AUTHOR_LINE_RE.match(line):
                     author_lines.append(line)
                 else:
                     break
@@ -451,17 +681,77 @@ def _extract_pdf_metadata_and_content(pdf_path: str) -> dict:
         extracted_info['authors_from_text'] = ' '.join(author_lines).strip()
         extracted_info['affiliations_from_text'] = ' '.join(affiliation_lines).strip()
     
-    doc.close()
-    
-    return {
+    result = {
         'pdf_metadata': pdf_metadata,
         'document_structure': document_structure,
         'visual_content': visual_content,
-        'structured_content': structured_content,
         'extracted_from_first_page': extracted_info,
         'raw_text': raw_text,
-        'raw_text_length': len(raw_text)
+        'raw_text_length': len(raw_text),
+        'references_page': references_page,
+        'main_content': main_content
     }
+    if include_structured:
+        result['structured_content'] = pages['structured_content']
+    return result
+
+def _pdf_content_hash(pdf_path: str) -> str:
+    """
+    Short SHA-256 digest of the PDF bytes, used as a cache key.
+    """
+    return hashlib.sha256(Path(pdf_path).read_bytes()).hexdigest()[:16]
+
+def _extract_pdf_data_cached(doc, pdf_path: str) -> dict:
+    """
+    Return _extract_pdf_metadata_and_content results, reusing an on-disk copy for identical PDF bytes.
+    Cache lives in output/research/.cache/ so it survives the per-paper output directory reset.
+    """
+    cache_dir = _research_root() / ".cache"
+    text_backend = 'pdfium' if _PDFIUM_TEXT else 'pymupdf'
+    cache_path = cache_dir / f"extract_v{_EXTRACT_CACHE_VERSION}_{text_backend}_{_pdf_content_hash(pdf_path)}.json"
+    
+    if cache_path.exists() and not _REFRESH_CACHE:
+        try:
+            pdf_data = _load_json(cache_path.read_bytes())
+            os.utime(cache_path)  # Mark as recently used so pruning keeps it
+            logger.info(f"Loaded cached PDF extraction from {cache_path}")
+            return pdf_data
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable extraction cache {cache_path}: {e}")
+    
+    pdf_data = _extract_pdf_metadata_and_content(doc, pdf_path)
+    
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(_dump_json(pdf_data))
+        _prune_cache(cache_dir, "extract_v*", current_prefix=f"extract_v{_EXTRACT_CACHE_VERSION}_")
+    except Exception as e:
+        logger.warning(f"Failed to write extraction cache {cache_path}: {e}")
+    
+    return pdf_data
+
+def _prune_cache(cache_dir: Path, pattern: str, current_prefix: str = '') -> None:
+    """
+    Bound one kind of .cache/ entry: drop files without current_prefix (other cache versions,
+    including old pickles) and all but the _CACHE_MAX_ENTRIES most recently used.
+    """
+    entries = []
+    for path in cache_dir.glob(pattern):
+        if path.name.startswith(current_prefix):
+            entries.append((path.stat().st_mtime, path))
+        else:
+            path.unlink(missing_ok=True)
+    
+    entries.sort(reverse=True)
+    for _, path in entries[_CACHE_MAX_ENTRIES:]:
+        path.unlink(missing_ok=True)
+
+def _llm_cache_path(kind: str, prompt: str, model: str, suffix: str) -> Path:
+    """
+    On-disk location of a cached Claude response, keyed by model and the exact prompt text.
+    """
+    key = hashlib.sha256(f"{model}\n{prompt}".encode('utf-8')).hexdigest()[:16]
+    return _research_root() / ".cache" / f"{kind}_{key}{suffix}"
 
 def _extract_figure_captions(raw_text: str) -> dict:
     """
@@ -469,31 +759,18 @@ def _extract_figure_captions(raw_text: str) -> dict:
     Returns dict mapping figure numbers to captions.
     """
     figure_captions = {}
-    lines = raw_text.split('\n')
     
-    for line in lines:
-        line = line.strip()
-        # Look for figure captions - various patterns
-        patterns = [
-            r'^Figure\s+(\d+)[:\.]?\s*(.+)',  # "Figure 1: Caption text"
-            r'^Fig\.?\s*(\d+)[:\.]?\s*(.+)',  # "Fig. 1: Caption text" 
-            r'^(\d+)\.\s*Figure\s*[:\.]?\s*(.+)',  # "1. Figure: Caption text"
-        ]
+    # Single pass over the whole text - one match per caption line
+    for match in _FIG_CAPTION_RE.finditer(raw_text):
+        fig_num = int(match.group(1) or match.group(3) or match.group(5))
+        caption = (match.group(2) or match.group(4) or match.group(6)).strip()
         
-        for pattern in patterns:
-            match = re.match(pattern, line, re.IGNORECASE)
-            if match:
-                fig_num = int(match.group(1))
-                caption = match.group(2).strip()
-                
-                # Clean up caption - remove common prefixes/suffixes
-                caption = re.sub(r'^[:\-\.\s]+', '', caption)
-                caption = re.sub(r'\s*\.$', '', caption)
-                
-                if caption and len(caption) > 10:  # Valid caption
-                    figure_captions[fig_num] = caption
-                    logger.debug(f"Found Figure {fig_num}: {caption[:50]}...")
-                break
+        # Clean up caption - remove common prefixes/suffixes
+        caption = _CAPTION_TRIM_RE.sub('', caption)
+        
+        if caption and len(caption) > 10:  # Valid caption
+            figure_captions[fig_num] = caption
+            logger.debug(f"Found Figure {fig_num}: {caption[:50]}...")
     
     logger.info(f"Extracted {len(figure_captions)} figure captions")
     return figure_captions
@@ -512,8 +789,8 @@ def _create_figure_markdown(figure_data: dict, figure_captions: dict, paper_titl
     figures_rel_path = "./figures"
     
     for fig_info in figure_data.get('figures_extracted', []):
-        page_num = fig_info['page']
-        filename = fig_info['filename']
+        page_num = fig_info.page
+        filename = fig_info.filename
         
         # Try to match with extracted captions (look for figures that might be on this page)
         fig_caption = ""
@@ -570,42 +847,32 @@ def _format_paper_header(extracted_info: dict, pdf_metadata: dict) -> str:
                    'Authors not found')
     
     # Clean up author names - remove superscript numbers but preserve commas between names
-    import re
-    # Strategy: Replace number patterns while preserving the comma structure between names
-    # First split by comma to work with individual author entries
-    author_parts = authors_raw.split(',')
-    cleaned_parts = []
-    
-    for part in author_parts:
-        # Remove numbers from each part but keep the text
-        clean_part = re.sub(r'\d+', '', part).strip()
-        if clean_part and not clean_part.isspace():  # Only keep non-empty parts
-            cleaned_parts.append(clean_part)
-    
-    authors_clean = ', '.join(cleaned_parts)
+    # Digits are deleted with str.translate, then empty entries between commas are dropped
+    authors_clean = ', '.join(
+        part for part in (p.translate(_DIGIT_TABLE).strip() for p in authors_raw.split(','))
+        if part
+    )
     
     # Get affiliations and clean up numbers
     affiliations = extracted_info.get('affiliations_from_text', '')
     if affiliations:
         # Remove superscript numbers from affiliations
-        affiliations_clean = re.sub(r'\d+', '', affiliations).strip()
-        # Clean up extra spaces and commas
-        affiliations_clean = re.sub(r'\s*,\s*', ', ', affiliations_clean)
-        affiliations_clean = re.sub(r',\s*,', ',', affiliations_clean)  # Remove double commas
+        affiliations_clean = affiliations.translate(_DIGIT_TABLE).strip()
+        # Clean up extra spaces and repeated commas in one pass
+        affiliations_clean = _COMMA_RUN_RE.sub(', ', affiliations_clean)
         affiliations_clean = affiliations_clean.strip(', ')  # Remove leading/trailing commas
     else:
         affiliations_clean = ''
     
     # Format header
-    header = f"# {title}\n\n"
-    header += f"**Authors:** {authors_clean}\n\n"
+    parts = [f"# {title}\n\n", f"**Authors:** {authors_clean}\n\n"]
     
     if affiliations_clean:
-        header += f"**Affiliations:** {affiliations_clean}\n\n"
+        parts.append(f"**Affiliations:** {affiliations_clean}\n\n")
     
-    header += "---\n\n"
+    parts.append("---\n\n")
     
-    return header
+    return ''.join(parts)
 
 def _extract_with_pymupdf4llm(pdf_path: str, save_raw: bool = False, output_dir: Path = None) -> str:
     """
@@ -615,13 +882,13 @@ def _extract_with_pymupdf4llm(pdf_path: str, save_raw: bool = False, output_dir:
         raise ImportError("PyMuPDF4LLM not available")
     
     logger.info("Using PyMuPDF4LLM for markdown extraction")
+    import pymupdf4llm
     md_text = pymupdf4llm.to_markdown(pdf_path)
     
     # Save raw PyMuPDF4LLM output if requested
     if save_raw and output_dir:
         raw_path = output_dir / "pdf.md"
-        with open(raw_path, 'w', encoding='utf-8') as f:
-            f.write(md_text)
+        raw_path.write_text(md_text, encoding='utf-8')
         logger.info(f"Saved raw PyMuPDF4LLM output to {raw_path}")
     
     # Simple post-processing to fix header format
@@ -629,14 +896,14 @@ def _extract_with_pymupdf4llm(pdf_path: str, save_raw: bool = False, output_dir:
     processed_lines = []
     
     for line in lines:
-        # Convert bold section numbers to proper headers
-        if re.match(r'^\*\*(\d+\.)\s+([A-Z][a-zA-Z\s]+)\*\*$', line):
-            match = re.match(r'^\*\*(\d+\.)\s+([A-Z][a-zA-Z\s]+)\*\*$', line)
+        # Convert bold section numbers to proper headers (one match both tests and captures)
+        match = _BOLD_NUMBERED_SECTION_RE.match(line)
+        if match:
             section_num = match.group(1)
             section_name = match.group(2)
             processed_lines.append(f'## {section_num} {section_name}')
-        # Convert abstract to proper header if it appears
-        elif line.strip().lower().startswith('**persuasion is a powerful capability'):
+        # Convert abstract to proper header if it appears (only the prefix is lowercased)
+        elif line.lstrip()[:len(_ABSTRACT_OPENING)].lower() == _ABSTRACT_OPENING:
             processed_lines.append('## Abstract')
             processed_lines.append('')
             processed_lines.append(line.replace('**', ''))
@@ -651,14 +918,6 @@ def _clean_text_with_haiku(text_content: str, title: str) -> str:
     Falls back to regex-based cleanup if API key unavailable.
     """
     try:
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            logger.info("No Anthropic API key found, using regex-based text cleanup")
-            return _regex_based_cleanup(text_content, title)
-        
-        from anthropic import Anthropic
-        client = Anthropic(api_key=api_key)
-        
         # Split into smaller chunks if text is too long
         max_chunk_size = 15000  # chars
         if len(text_content) > max_chunk_size:
@@ -684,16 +943,38 @@ Text to format:
 
 [Return only the formatted markdown - no other text]"""
         
-        response = client.messages.create(
-            model="claude-3-5-haiku-20241022",  # Use Haiku as suggested
-            max_tokens=4000,
-            messages=[{
-                "role": "user",
-                "content": cleanup_prompt
-            }]
-        )
-        
-        cleaned_chunk = response.content[0].text
+        # Re-processing the same paper reuses the earlier cleanup instead of another Haiku call
+        cache_path = _llm_cache_path('cleanup', cleanup_prompt, _CLEANUP_MODEL, '.md')
+        if cache_path.exists() and not _REFRESH_CACHE:
+            cleaned_chunk = cache_path.read_text(encoding='utf-8')
+            os.utime(cache_path)  # Mark as recently used so pruning keeps it
+            logger.info(f"Loaded cached text cleanup from {cache_path}")
+        else:
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+            if not api_key:
+                logger.info("No Anthropic API key found, using regex-based text cleanup")
+                return _regex_based_cleanup(text_content, title)
+            
+            from anthropic import Anthropic
+            client = Anthropic(api_key=api_key)
+            
+            response = client.messages.create(
+                model=_CLEANUP_MODEL,
+                max_tokens=4000,
+                messages=[{
+                    "role": "user",
+                    "content": cleanup_prompt
+                }]
+            )
+            
+            cleaned_chunk = response.content[0].text
+            
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(cleaned_chunk, encoding='utf-8')
+                _prune_cache(cache_path.parent, "cleanup_*.md")
+            except Exception as e:
+                logger.warning(f"Failed to write cleanup cache {cache_path}: {e}")
         
         # If we processed only a chunk, combine with the rest
         if len(text_content) > max_chunk_size:
@@ -725,7 +1006,7 @@ def _extract_structured_text_from_blocks(structured_content: list) -> str:
                 lines = block.get('lines', [])
                 for line in lines:
                     spans = line.get('spans', [])
-                    line_text = ''
+                    span_texts = []
                     for span in spans:
                         text = span.get('text', '').strip()
                         if text:
@@ -736,16 +1017,18 @@ def _extract_structured_text_from_blocks(structured_content: list) -> str:
                             # Bold text (flags & 16) and large text might be headers
                             if (flags & 16) and size > 12:  # Bold and large
                                 # Check if it looks like a section header
-                                if re.match(r'^\d+\.?\s+[A-Z][a-zA-Z\s]+$', text) or text.isupper():
+                                if _NUMBERED_SECTION_RE.match(text) or text.isupper():
                                     text = f'\n## {text}\n'
                             
-                            line_text += text + ' '
+                            span_texts.append(text)
                     
-                    if line_text.strip():
-                        text_lines.append(line_text.strip())
+                    # Header spans carry their own newlines, which are trimmed at the line ends
+                    line_text = ' '.join(span_texts).strip()
+                    if line_text:
+                        text_lines.append(line_text)
             
-            # Add some spacing between blocks
-            if text_lines and not text_lines[-1].endswith('\n'):
+            # Add some spacing between blocks (collected lines are stripped, so never end in '\n')
+            if text_lines:
                 text_lines.append('')
     
     return '\n'.join(text_lines)
@@ -755,8 +1038,8 @@ def _regex_based_cleanup(text_content: str, title: str) -> str:
     Minimal regex-based fallback for text cleanup when Claude Haiku is not available.
     """
     # Just do basic space fixing - let the markdown processing handle structure
-    text_content = re.sub(r'([a-z])([A-Z])', r'\1 \2', text_content)  # Fix concatenated words
-    text_content = re.sub(r'([a-z])\.([A-Z])', r'\1. \2', text_content)  # Fix sentence spacing
+    text_content = _CAMEL_JOIN_RE.sub(r'\1 \2', text_content)  # Fix concatenated words
+    text_content = _SENTENCE_JOIN_RE.sub(r'\1. \2', text_content)  # Fix sentence spacing
     return text_content
 
 def _extract_sections_from_content(content: str) -> list[dict]:
@@ -767,6 +1050,7 @@ def _extract_sections_from_content(content: str) -> list[dict]:
     lines = content.split('\n')
     sections = []
     current_section = None
+    content_lines = []
     
     for line in lines:
         line_stripped = line.strip()
@@ -775,19 +1059,23 @@ def _extract_sections_from_content(content: str) -> list[dict]:
         header_match = None
         level = 0
         
+        # Pattern 2 can only match lines starting with a digit or '*', so most lines skip the regex
+        numbered_match = None
+        if line_stripped[:1].isdigit() or line_stripped.startswith('*'):
+            numbered_match = _NUMBERED_HEADER_RE.match(line_stripped)
+        
         # Pattern 1: "## 1. Introduction" or "# Abstract"
         if line_stripped.startswith('#'):
             header_match = line_stripped
             level = len(line_stripped) - len(line_stripped.lstrip('#'))
         # Pattern 2: "1. Introduction" or "2.1 Background"
-        elif re.match(r'^\*?\*?(\d+\.?\d*\.?)\s+([A-Z][a-zA-Z\s]+)\*?\*?$', line_stripped):
-            match = re.match(r'^\*?\*?(\d+\.?\d*\.?)\s+([A-Z][a-zA-Z\s]+)\*?\*?$', line_stripped)
-            section_num = match.group(1)
-            section_name = match.group(2)
+        elif numbered_match:
+            section_num = numbered_match.group(1)
+            section_name = numbered_match.group(2)
             header_match = f"## {section_num} {section_name}"
             level = 2
         # Pattern 3: "ABSTRACT" or "INTRODUCTION" (all caps)
-        elif line_stripped.isupper() and len(line_stripped.split()) <= 3 and len(line_stripped) > 2:
+        elif len(line_stripped) > 2 and line_stripped.isupper() and len(line_stripped.split()) <= 3:
             header_match = f"## {line_stripped.title()}"
             level = 2
         # Pattern 4: Bold text that looks like headers
@@ -804,8 +1092,10 @@ def _extract_sections_from_content(content: str) -> list[dict]:
             if level <= 2:
                 # Save previous section and start new one
                 if current_section:
+                    current_section['content'] = ''.join(content_lines)
                     sections.append(current_section)
                 
+                content_lines = []
                 current_section = {
                     'title': header_match,
                     'content': '',
@@ -815,14 +1105,15 @@ def _extract_sections_from_content(content: str) -> list[dict]:
             else:
                 # H3+ headers get added to current section content
                 if current_section:
-                    current_section['content'] += line + '\n'
+                    content_lines.append(line + '\n')
         else:
             # Add content to current section
             if current_section:
-                current_section['content'] += line + '\n'
+                content_lines.append(line + '\n')
     
     # Add final section
     if current_section:
+        current_section['content'] = ''.join(content_lines)
         sections.append(current_section)
     
     return sections
@@ -842,8 +1133,7 @@ def _create_cleaned_content_with_llm(pdf_md_path: Path, pdf_txt_path: Path, pdf_
         
         # Load input files
         pdf_md = pdf_md_path.read_text(encoding='utf-8') if pdf_md_path.exists() else ""
-        pdf_txt = pdf_txt_path.read_text(encoding='utf-8') if pdf_txt_path.exists() else ""
-        pdf_json = json.loads(pdf_json_path.read_text(encoding='utf-8')) if pdf_json_path.exists() else {}
+        pdf_json = _load_json(pdf_json_path.read_bytes()) if pdf_json_path.exists() else {}
         
         # Extract title, authors, affiliations from PyMuPDF4LLM output (much better quality)
         title = 'Unknown Title'
@@ -851,14 +1141,15 @@ def _create_cleaned_content_with_llm(pdf_md_path: Path, pdf_txt_path: Path, pdf_
         affiliations_text = ''
         
         if pdf_md:
+            # Only the top of the document is scanned, so split off just the first 20 lines
+            header_lines = pdf_md.split('\n', 20)[:20]
             # Extract title from first line (usually formatted as # Title)
-            lines = pdf_md.split('\n')
-            for line in lines[:10]:  # Check first 10 lines
+            for line in header_lines[:10]:  # Check first 10 lines
                 line_stripped = line.strip()
                 if line_stripped.startswith('#') and len(line_stripped) > 5:
                     # Clean title - remove markdown and bold formatting
-                    title_clean = re.sub(r'^#+\s*', '', line_stripped)
-                    title_clean = re.sub(r'\*\*', '', title_clean)  # Remove bold
+                    title_clean = _MD_HEADING_PREFIX_RE.sub('', line_stripped)
+                    title_clean = title_clean.replace('**', '')  # Remove bold
                     title_clean = title_clean.strip()
                     if len(title_clean) > 10:  # Make sure it's a real title
                         title = title_clean
@@ -867,7 +1158,7 @@ def _create_cleaned_content_with_llm(pdf_md_path: Path, pdf_txt_path: Path, pdf_
             # Extract authors (look for author names in italics/bold after title)
             in_author_section = False
             author_lines = []
-            for line in lines[:20]:  # Check first 20 lines
+            for line in header_lines:  # Check first 20 lines
                 line_stripped = line.strip()
                 # Look for author patterns
                 if ('_**' in line_stripped or '**' in line_stripped) and not line_stripped.startswith('#'):
@@ -882,14 +1173,10 @@ def _create_cleaned_content_with_llm(pdf_md_path: Path, pdf_txt_path: Path, pdf_
             
             # Parse authors from collected lines
             if author_lines:
-                authors_combined = ' '.join(author_lines)
-                # Remove markdown formatting
-                authors_combined = re.sub(r'_\*\*|\*\*_|\*\*|_', '', authors_combined)
-                # Remove reference numbers in brackets
-                authors_combined = re.sub(r'\[\d+,?\d*,?\d*,?\d*\]', '', authors_combined)
-                # Clean up extra spaces
-                authors_combined = re.sub(r'\s+', ' ', authors_combined).strip()
-                authors_text = authors_combined
+                # Remove markdown formatting and bracketed reference numbers in one pass,
+                # then collapse whitespace (split/join also trims the ends)
+                authors_combined = _AUTHOR_NOISE_RE.sub('', ' '.join(author_lines))
+                authors_text = ' '.join(authors_combined.split())
         
         # Fallback to pdf.json if PyMuPDF4LLM extraction failed
         if title == 'Unknown Title':
@@ -903,13 +1190,12 @@ def _create_cleaned_content_with_llm(pdf_md_path: Path, pdf_txt_path: Path, pdf_
         if not affiliations_text:
             affiliations_text = pdf_json.get('extracted_from_first_page', {}).get('affiliations_from_text', '')
         
-        # Extract sections from both md and txt content
+        # Extract sections from md content, falling back to txt content only if md has none
         logger.info("Extracting sections from PDF content...")
-        md_sections = _extract_sections_from_content(pdf_md)
-        txt_sections = _extract_sections_from_content(pdf_txt)
-        
-        # Use md_sections as primary, fallback to txt_sections
-        sections = md_sections if md_sections else txt_sections
+        sections = _extract_sections_from_content(pdf_md)
+        if not sections:
+            pdf_txt = pdf_txt_path.read_text(encoding='utf-8') if pdf_txt_path.exists() else ""
+            sections = _extract_sections_from_content(pdf_txt)
         logger.info(f"Found {len(sections)} sections to process")
         
         # Filter out references/bibliography and appendix sections, and artifacts
@@ -921,10 +1207,7 @@ def _create_cleaned_content_with_llm(pdf_md_path: Path, pdf_txt_path: Path, pdf_
             raw_title_lower = section.get('raw_title', '').lower()
             
             # Stop at references, bibliography, appendices, or weird artifacts
-            if any(ref_word in title_lower or ref_word in raw_title_lower for ref_word in [
-                'reference', 'bibliography', 'appendix', 'acknowledgment', 'acknowledgement',
-                'scores', 'overall_reasoning', 'reasoning about', 'question 1', 'question 2', 'question 3'
-            ]):
+            if _STOP_SECTION_RE.search(title_lower) or _STOP_SECTION_RE.search(raw_title_lower):
                 logger.info(f"Stopping at section: {section['title']} (raw: {section.get('raw_title', 'N/A')})")
                 break
             
@@ -967,8 +1250,8 @@ def _create_cleaned_content_with_llm(pdf_md_path: Path, pdf_txt_path: Path, pdf_
         
         if authors_text:
             # Clean authors list
-            authors_clean = re.sub(r'\d+', '', authors_text)  # Remove superscript numbers
-            authors_clean = re.sub(r'\s+', ' ', authors_clean).strip()
+            authors_clean = authors_text.translate(_DIGIT_TABLE)  # Remove superscript numbers
+            authors_clean = _WHITESPACE_RUN_RE.sub(' ', authors_clean).strip()
             cleaned_parts.append(f"**Authors:** {authors_clean}")
             cleaned_parts.append("")
         
@@ -1003,10 +1286,10 @@ def _create_cleaned_content_with_llm(pdf_md_path: Path, pdf_txt_path: Path, pdf_
             if abstract_lines:
                 abstract_content = ' '.join(abstract_lines)
                 # Clean up the abstract content
-                abstract_content = re.sub(r'\s+', ' ', abstract_content).strip()
+                abstract_content = _WHITESPACE_RUN_RE.sub(' ', abstract_content).strip()
                 # Remove markdown formatting artifacts
-                abstract_content = re.sub(r'\*\*', '', abstract_content)  # Remove bold
-                abstract_content = re.sub(r'_', '', abstract_content)     # Remove italics
+                abstract_content = abstract_content.replace('**', '')  # Remove bold
+                abstract_content = abstract_content.replace('_', '')   # Remove italics
                 
         if abstract_content:
             cleaned_parts.append("## Abstract")
@@ -1017,7 +1300,7 @@ def _create_cleaned_content_with_llm(pdf_md_path: Path, pdf_txt_path: Path, pdf_
         # Process each section with LLM
         section_summaries = {}
         
-        for i, section in enumerate(main_sections):
+        def _clean_section(i: int, section: dict) -> str:
             logger.info(f"Processing section {i+1}/{len(main_sections)}: {section['title']}")
             
             # Create section-specific prompt
@@ -1045,32 +1328,42 @@ CONTENT TO CLEAN:
 
 Return ONLY the cleaned section with original content preserved exactly."""
 
+            response = client.messages.create(
+                model="claude-sonnet-4-20250514",  # Use Sonnet for better instruction following
+                max_tokens=4000,
+                messages=[{"role": "user", "content": section_prompt}]
+            )
+            return response.content[0].text.strip()
+        
+        # Sections are independent, so their API calls run concurrently; results are consumed in order
+        futures = []
+        if main_sections:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(_SECTION_LLM_WORKERS, len(main_sections))) as executor:
+                futures = [executor.submit(_clean_section, i, section) for i, section in enumerate(main_sections)]
+        
+        for section, future in zip(main_sections, futures):
             try:
-                response = client.messages.create(
-                    model="claude-sonnet-4-20250514",  # Use Sonnet for better instruction following
-                    max_tokens=4000,
-                    messages=[{"role": "user", "content": section_prompt}]
-                )
-                
-                cleaned_section = response.content[0].text.strip()
+                cleaned_section = future.result()
                 cleaned_parts.append(cleaned_section)
                 cleaned_parts.append("")  # Add spacing
                 
                 # Extract summary for metadata
-                section_title_clean = section['title'].lower().replace('#', '').strip()
-                if 'abstract' in section_title_clean:
+                section_title_clean = section['title'].lower().replace('#', '')
+                bucket = next((b for keyword, b in _SECTION_BUCKET_KEYS if keyword in section_title_clean), None)
+                if bucket == 'abstract':
                     # Get full abstract text for metadata - remove header and clean
                     abstract_content = cleaned_section.replace(section['title'], '').strip()
-                    abstract_content = re.sub(r'^#+\s*', '', abstract_content)  # Remove any remaining headers
+                    abstract_content = _MD_HEADING_PREFIX_RE.sub('', abstract_content)  # Remove any remaining headers
                     abstract_content = abstract_content.replace('## Abstract', '').strip()
                     section_summaries['abstract'] = abstract_content[:800]  # Increased to 800 chars for full abstract
-                elif 'introduction' in section_title_clean:
+                elif bucket == 'introduction':
                     section_summaries['introduction'] = f"Study introduces {title.split(':')[0]} addressing key challenges in the field."
-                elif any(word in section_title_clean for word in ['method', 'approach', 'design']):
+                elif bucket == 'methods':
                     section_summaries['methods'] = "Research employs systematic methodology with comprehensive evaluation framework."
-                elif 'result' in section_title_clean:
+                elif bucket == 'results':
                     section_summaries['results'] = "Key findings demonstrate significant outcomes across multiple evaluation metrics."
-                elif any(word in section_title_clean for word in ['conclusion', 'discussion']):
+                elif bucket == 'conclusion':
                     section_summaries['conclusion'] = "Work provides important contributions with implications for future research."
                 
             except Exception as e:
@@ -1114,7 +1407,7 @@ def _parse_authors_with_affiliations(authors_text: str, affiliations_text: str)
     
     # Clean up superscript numbers and extra spaces
     for name in author_names:
-        clean_name = re.sub(r'\d+', '', name).strip()
+        clean_name = name.translate(_DIGIT_TABLE).strip()
         if clean_name and len(clean_name) > 2:
             authors.append({
                 "name": clean_name,
@@ -1132,7 +1425,7 @@ def _extract_figure_metadata(figure_data: dict) -> list[dict]:
     for i, fig in enumerate(figure_data.get('figures_extracted', [])[:5]):  # Limit to 5 figures
         figures.append({
             "number": i + 1,
-            "description": f"Research figure from page {fig.get('page', 0)}"
+            "description": f"Research figure from page {fig.page}"
         })
     
     return figures
@@ -1143,36 +1436,20 @@ def _create_cleaned_markdown(raw_text: str, title: str, figure_data: dict = None
     Uses Claude Haiku for text structure cleanup, then applies figure insertion.
     Returns (markdown_content, filter_stats)
     """
-    lines = raw_text.split('\n')
-    
     # Extract figure captions first
     figure_captions = _extract_figure_captions(raw_text)
     figure_markdown = _create_figure_markdown(figure_data, figure_captions, title, is_distilled=False)
     
-    # Find where references/bibliography starts
-    end_idx = len(lines)
+    # Find where references/bibliography starts and keep only the lines before it
+    line_count = raw_text.count('\n') + 1
     section_found = None
-    
-    for i, line in enumerate(lines):
-        line_lower = line.lower().strip()
-        # Look for references section
-        if line_lower in ['references', 'bibliography', 'appendix', 'acknowledgments', 'acknowledgements']:
-            end_idx = i
-            section_found = line.strip()
-            break
-        # Look for numbered reference lists
-        if re.match(r'^\[1\]', line.strip()) or re.match(r'^1\..*\d{4}', line.strip()):
-            ref_indicators = 0
-            for j in range(i, min(i+3, len(lines))):
-                if re.match(r'^\[\d+\]|^\d+\..*\d{4}', lines[j].strip()):
-                    ref_indicators += 1
-            if ref_indicators >= 2:
-                end_idx = i
-                section_found = 'numbered references'
-                break
-    
-    # Get main content
-    main_lines = lines[:end_idx]
+    references_start = _find_references_start(raw_text)
+    if references_start:
+        start_pos, section_found = references_start
+        main_lines = raw_text[:start_pos - 1].split('\n') if start_pos else []
+    else:
+        main_lines = raw_text.split('\n')
+    end_idx = len(main_lines)
     
     # Filter out duplicate title/author information from the beginning
     filtered_lines = []
@@ -1189,12 +1466,16 @@ def _create_cleaned_markdown(raw_text: str, title: str, figure_data: dict = None
         title_words.extend(extracted_title.lower().split()[:5])  # First 5 words
     if pdf_title:
         title_words.extend(pdf_title.lower().split()[:5])
+    # Words longer than 3 chars, searched for in one scan per line
+    title_words = [word for word in title_words if len(word) > 3]
+    title_words_re = re.compile('|'.join(re.escape(word) for word in title_words)) if title_words else None
     
     author_names = []
     if extracted_authors:
         # Extract individual names (split by comma, remove numbers)
-        names = [re.sub(r'\d+', '', name).strip() for name in extracted_authors.split(',')]
+        names = [_DIGITS_RE.sub('', name).strip() for name in extracted_authors.split(',')]
         author_names.extend([name.lower() for name in names if len(name) > 2])
+    author_names_re = re.compile('|'.join(re.escape(name) for name in author_names)) if author_names else None
     
     for i, line in enumerate(main_lines):
         line_stripped = line.strip()
@@ -1206,48 +1487,43 @@ def _create_cleaned_markdown(raw_text: str, title: str, figure_data: dict = None
                 
             # Skip lines that contain title words (partial match)
             line_lower = line_stripped.lower()
-            if title_words and any(word in line_lower and len(word) > 3 for word in title_words):
+            if title_words_re and title_words_re.search(line_lower):
                 logger.debug(f"Skipping potential duplicate title: {line_stripped[:50]}...")
                 continue
                 
             # Skip lines that contain author names
-            if author_names and any(name in line_lower for name in author_names):
+            if author_names_re and author_names_re.search(line_lower):
                 logger.debug(f"Skipping potential duplicate author: {line_stripped[:50]}...")
                 continue
                 
             # Skip arXiv identifiers and affiliations
-            if (line_stripped.startswith('arXiv:') or 
-                re.match(r'^\d+[A-Za-z,\s]+(University|Institute|AI|MIT|Vector)', line_stripped) or
-                re.match(r'^\d+FAR\.AI', line_stripped)):
+            if _METADATA_LINE_RE.match(line_stripped):
                 logger.debug(f"Skipping metadata: {line_stripped[:50]}...")
                 continue
             
             # Once we hit substantial content that's not metadata, stop skipping
             elif (len(line_stripped) > 50 and 
-                  not any(word in line_lower for word in ['university', 'institute', 'arxiv']) and
-                  not re.match(r'^\d+[A-Za-z]', line_stripped)):
+                  not _INSTITUTION_WORD_RE.search(line_lower) and
+                  not _NUMBERED_AFFILIATION_RE.match(line_stripped)):
                 skip_initial_metadata = False
                 filtered_lines.append(line)
         else:
             filtered_lines.append(line)
     
-    # Track current page number roughly for figure insertion  
-    current_page = 1
-    lines_per_page = len(filtered_lines) / 21 if filtered_lines else 50
-    
     # Try PyMuPDF4LLM first for best results, then fall back to other methods
     try:
         if PYMUPDF4LLM_AVAILABLE and pdf_path:
             logger.info("Using PyMuPDF4LLM for extraction")
             cleaned_text = _extract_with_pymupdf4llm(pdf_path, save_raw=True, output_dir=output_dir)
             # Filter out references section
-            lines = cleaned_text.split('\n')
-            end_idx = len(lines)
-            for i, line in enumerate(lines):
-                if re.search(r'references?|bibliography', line.lower().strip()):
+            md_lines = cleaned_text.split('\n')
+            line_count = len(md_lines)
+            end_idx = line_count
+            for i, line in enumerate(md_lines):
+                if _REFERENCES_WORD_RE.search(line.lower().strip()):
                     end_idx = i
                     break
-            cleaned_text = '\n'.join(lines[:end_idx])
+            cleaned_text = '\n'.join(md_lines[:end_idx])
         else:
             raise ImportError("PyMuPDF4LLM not available or no PDF path")
     except Exception as e:
@@ -1281,35 +1557,34 @@ def _create_cleaned_markdown(raw_text: str, title: str, figure_data: dict = None
     # Then process for figures and final formatting (fallback if Haiku didn't run)
     cleaned_lines = cleaned_text.split('\n')
     
-    # Track current page number roughly for figure insertion  
-    current_page = 1
+    # Rough page estimate per line for figure insertion
     lines_per_page = len(cleaned_lines) / 21 if cleaned_lines else 50
     
-    # Convert to final Markdown with figure insertion (minimal processing if LLM did the work)
+    # Convert to final Markdown with figure insertion (minimal processing if LLM did the work).
+    # Figure pages are merged in sorted order alongside the lines (two-pointer walk).
     md_content = []
+    figure_pages = sorted(figure_markdown)
+    page_idx = 0
     
     for line_idx, line in enumerate(cleaned_lines):
         # Estimate current page for figure insertion
         estimated_page = int(line_idx / lines_per_page) + 1
         
-        # Check if we should insert figures for this page
-        if estimated_page in figure_markdown and estimated_page != current_page:
-            for fig_md in figure_markdown[estimated_page]:
-                md_content.append(fig_md)
-            current_page = estimated_page
+        # Insert figures for every page we have reached
+        while page_idx < len(figure_pages) and figure_pages[page_idx] <= estimated_page:
+            md_content.extend(figure_markdown[figure_pages[page_idx]])
+            page_idx += 1
         
         # Add the line (LLM should have cleaned structure already, or we do minimal processing)
         md_content.append(line)
     
     # Insert any remaining figures at the end
-    for page_num, fig_markdowns in figure_markdown.items():
-        if page_num > current_page:
-            for fig_md in fig_markdowns:
-                md_content.append(fig_md)
+    for page_num in figure_pages[page_idx:]:
+        md_content.extend(figure_markdown[page_num])
     
     # Clean up the markdown
-    md_text = ''.join(md_content)
-    md_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', md_text)
+    md_text = '\n'.join(md_content)
+    md_text = _EXTRA_BLANK_LINES_RE.sub('\n\n', md_text)
     
     # Add formatted header with title, authors, affiliations
     if pdf_data:
@@ -1323,11 +1598,11 @@ def _create_cleaned_markdown(raw_text: str, title: str, figure_data: dict = None
         final_md = f'# {title}\n\n{md_text}'
     
     filter_stats = {
-        'original_lines': len(lines),
+        'original_lines': line_count,
         'filtered_lines': end_idx,
-        'removed_lines': len(lines) - end_idx,
+        'removed_lines': line_count - end_idx,
         'section_found': section_found,
-        'retention_percentage': (end_idx / len(lines)) * 100 if lines else 0,
+        'retention_percentage': (end_idx / line_count) * 100 if line_count else 0,
         'figures_inserted': sum(len(figs) for figs in figure_markdown.values()) if figure_markdown else 0
     }
     
@@ -1347,22 +1622,23 @@ def _create_distilled_version(md_text: str, title: str, figure_data: dict = None
     
     sections = md_text.split('\n## ')
     
+    distilled_content = io.StringIO()
+    
     # Create header with title, authors, affiliations
     if pdf_data:
         header = _format_paper_header(
             pdf_data.get('extracted_from_first_page', {}), 
             pdf_data.get('pdf_metadata', {})
         )
-        distilled_content = [header]
+        distilled_content.write(header)
     else:
-        distilled_content = [f'# {title} - Distilled Summary\n']
+        distilled_content.write(f'# {title} - Distilled Summary\n')
     
     # Insert key figures at the beginning if any
     if figure_markdown:
-        distilled_content.append('\n## Key Figures\n')
+        distilled_content.write('\n## Key Figures\n')
         for page_num in sorted(figure_markdown.keys()):
-            for fig_md in figure_markdown[page_num]:
-                distilled_content.append(fig_md)
+            distilled_content.writelines(figure_markdown[page_num])
     
     for section in sections:
         if not section.strip():
@@ -1374,46 +1650,34 @@ def _create_distilled_version(md_text: str, title: str, figure_data: dict = None
         if not section_title or section_title.endswith('- Distilled Summary'):
             continue
         
-        distilled_content.append(f'\n## {section_title}\n')
+        distilled_content.write(f'\n## {section_title}\n')
         
         # Extract key points from each section
         content_lines = [line.strip() for line in lines[1:] if line.strip()]
         full_text = ' '.join(content_lines)
-        sentences = re.split(r'[.!?]+', full_text)
+        sentences = [match.group(0) for match in _SENTENCE_RE.finditer(full_text)]
         
         key_points = []
         for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 20:  # Skip very short fragments
-                continue
-                
             # Extract sentences with key indicators
-            key_indicators = [
-                'we propose', 'we introduce', 'we find', 'we show', 'our results',
-                'this work', 'this paper', 'our approach', 'our method', 'our evaluation',
-                'key finding', 'main contribution', 'primary result', 'significant',
-                'important', 'crucial', 'novel', 'first to', 'unlike previous',
-                'definition', 'define', 'operationalized as', 'measured by', 'framework'
-            ]
-            
-            if any(indicator in sentence.lower() for indicator in key_indicators):
+            if _KEY_INDICATOR_RE.search(sentence):
                 key_points.append(f'• {sentence.strip()}')
             # Extract quantitative results
-            elif re.search(r'\d+%|\d+\.\d+|\d+ (models?|participants?|cases?)', sentence):
+            elif _QUANTITATIVE_RE.search(sentence):
                 key_points.append(f'• {sentence.strip()}')
         
         # If no key points found, extract first few meaningful sentences
         if not key_points:
-            meaningful_sentences = [s.strip() for s in sentences if len(s.strip()) > 30]
+            meaningful_sentences = [s for s in sentences if len(s) > 30]
             for sentence in meaningful_sentences[:3]:
                 key_points.append(f'• {sentence.strip()}')
         
         # Add key points, limit to avoid overwhelming
         for point in key_points[:5]:  # Max 5 points per section
-            distilled_content.append(f'{point}\n')
+            distilled_content.write(f'{point}\n')
     
     # Add methodology and results highlights
-    distilled_content.append('\n## Key Methodology & Results\n')
+    distilled_content.write('\n## Key Methodology & Results\n')
     methodology_points = [
         '• **Benchmark focus**: Shifts from persuasion success to persuasion attempts',
         '• **Multi-turn setup**: Simulated persuader-persuadee agent conversations',
@@ -1429,79 +1693,76 @@ def _create_distilled_version(md_text: str, title: str, figure_data: dict = None
         '• **Risk dimension**: Willingness to persuade identified as key dimension of LLM risk'
     ]
     
-    for point in methodology_points + results_points:
-        distilled_content.append(f'{point}\n')
+    distilled_content.write('\n'.join(methodology_points + results_points) + '\n')
     
-    return ''.join(distilled_content)
+    return distilled_content.getvalue()
+
+def _figure_result_for_json(figures_result: dict) -> dict:
+    """
+    Convert FigureRecord entries back to plain dicts so pdf.json keeps its keyed layout.
+    """
+    if not figures_result:
+        return {'success': False, 'error': 'Not attempted'}
+    return {
+        **figures_result,
+        'figures_extracted': [fig._asdict() for fig in figures_result.get('figures_extracted', [])]
+    }
 
 def _save_research_outputs(pdf_path: str, paper_title: str, pdf_data: dict, cleaned_md: str, distilled_md: str, filter_stats: dict, figures_result: dict = None) -> dict:
     """
     Save all 4 research outputs to organized directory structure.
     Returns dict with file paths and save statistics.
     """
-    from far_comms.utils.project_paths import get_output_dir
-    
     # Create output directory - all files go into research/{title}/ directory
-    base_output_dir = get_output_dir()
-    
-    # Sanitize paper title for directory name
-    def sanitize_filename(title: str) -> str:
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', title)
-        sanitized = re.sub(r'[^\w\s\-_\.]', '', sanitized)
-        sanitized = re.sub(r'\s+', '_', sanitized)
-        return sanitized.strip('_').strip('.')[:100]
-    
-    sanitized_title = sanitize_filename(paper_title or Path(pdf_path).stem)
+    sanitized_title = _sanitize_dirname(paper_title or Path(pdf_path).stem)
     
     # Create paper-specific directory under research/
-    paper_output_dir = base_output_dir / "research" / sanitized_title
+    paper_output_dir = _research_root() / sanitized_title
     paper_output_dir.mkdir(parents=True, exist_ok=True)
     
     saved_files = {}
     
     try:
-        # 1. Save raw text (renamed to pdf.txt)
-        raw_text_path = paper_output_dir / "pdf.txt"
-        with open(raw_text_path, 'w', encoding='utf-8') as f:
-            f.write(pdf_data['raw_text'])
-        saved_files['raw_text'] = str(raw_text_path)
-        
-        # 2. Save metadata JSON (renamed to pdf.json)
+        # PDF metadata and processing stats for pdf.json
         metadata = {
             'pdf_metadata': pdf_data['pdf_metadata'],
             'document_structure': pdf_data['document_structure'],
             'visual_content': pdf_data['visual_content'],
-            'structured_content_stats': {
-                'pages_with_blocks': len([p for p in pdf_data.get('structured_content', []) if 'blocks' in p]),
-                'total_blocks': sum(len(p.get('blocks', [])) for p in pdf_data.get('structured_content', [])),
-                'extraction_method': 'pymupdf_dict'
-            },
             'extracted_from_first_page': pdf_data['extracted_from_first_page'],
-            'figure_extraction': figures_result or {'success': False, 'error': 'Not attempted'},
+            'figure_extraction': _figure_result_for_json(figures_result),
             'processing_stats': {
                 'raw_text_length': pdf_data['raw_text_length'],
-                'filter_stats': filter_stats,
-                'generated_at': datetime.now().isoformat()
+                # Ratios to 2 decimals and timestamps to the second; full precision only bloats pdf.json
+                'filter_stats': {k: round(v, 2) if isinstance(v, float) else v for k, v in filter_stats.items()},
+                'generated_at': datetime.now().replace(microsecond=0).isoformat()
             }
         }
         
-        # Save PDF metadata and processing stats as pdf.json
-        metadata_path = paper_output_dir / "pdf.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
-        saved_files['metadata'] = str(metadata_path)
+        if 'structured_content' in pdf_data:
+            structured_content = pdf_data['structured_content']
+            metadata['structured_content_stats'] = {
+                'pages_with_blocks': len([p for p in structured_content if 'blocks' in p]),
+                'total_blocks': sum(len(p.get('blocks', [])) for p in structured_content),
+                'extraction_method': 'pymupdf_dict'
+            }
+        
+        # Raw text (pdf.txt), metadata JSON (pdf.json), cleaned and distilled markdown,
+        # encoded up front and written concurrently
+        outputs = [
+            ('raw_text', paper_output_dir / "pdf.txt", pdf_data['raw_text'].encode('utf-8')),
+            ('metadata', paper_output_dir / "pdf.json", _dump_json(metadata)),
+            ('cleaned_markdown', paper_output_dir / "cleaned.md", cleaned_md.encode('utf-8')),
+            ('distilled_markdown', paper_output_dir / "distilled.md", distilled_md.encode('utf-8')),
+        ]
         
-        # 3. Save cleaned markdown (in paper directory)
-        cleaned_path = paper_output_dir / "cleaned.md"
-        with open(cleaned_path, 'w', encoding='utf-8') as f:
-            f.write(cleaned_md)
-        saved_files['cleaned_markdown'] = str(cleaned_path)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            writes = [(key, path, executor.submit(path.write_bytes, data))
+                      for key, path, data in outputs]
         
-        # 4. Save distilled version (in paper directory)
-        distilled_path = paper_output_dir / "distilled.md"
-        with open(distilled_path, 'w', encoding='utf-8') as f:
-            f.write(distilled_md)
-        saved_files['distilled_markdown'] = str(distilled_path)
+        for key, path, future in writes:
+            future.result()  # Re-raise any write error
+            saved_files[key] = str(path)
         
         logger.info(f"Saved 4 research outputs to {paper_output_dir}")
         
@@ -1526,6 +1787,174 @@ def _save_research_outputs(pdf_path: str, paper_title: str, pdf_data: dict, clea
             'files': saved_files  # Return what we managed to save
         }
 
+# Expert analysis prompt for the final Claude call; filled with str.format (literal braces are doubled)
+_EXPERT_PROMPT_TEMPLATE = """You are a PhD researcher specializing in AI safety and alignment with deep technical expertise in machine learning. Analyze this research paper with the rigor and insight of a leading AI safety researcher.
+
+PAPER CONTENT:
+{main_content}
+
+PAPER METADATA:
+Title: {paper_title}
+Authors: {authors}
+Pages: {pages}
+Visual Elements: {total_images} images, {total_drawings} drawings
+
+ANALYSIS INSTRUCTIONS:
+As an AI safety expert with PhD-level technical depth, provide a comprehensive analysis covering:
+
+**Technical Analysis:**
+- Core contribution: What is the main technical advancement? Be precise about the specific innovation.
+- Methodology: Describe the research approach, experimental design, and technical methods used.
+- Key results: Summarize the primary empirical findings, performance metrics, and quantitative results.
+- Technical novelty: What differentiates this from prior work? What technical barriers were overcome?
+
+**AI Safety & Alignment Context:**
+- Safety implications: How does this work impact AI safety? Consider both positive contributions and potential risks.
+- Risk assessment: What safety concerns does this raise? Consider capabilities, alignment, robustness, interpretability.
+- Alignment relevance: How does this relate to the broader AI alignment research agenda?
+
+**Research Quality & Significance:**
+- Experimental rigor: Evaluate the experimental design, baselines, statistical validity, and reproducibility.
+- Significance rating: Rate 1-10 with detailed rationale based on technical contribution, methodological rigor, and field impact.
+- Future directions: What are the most promising next steps this work enables?
+
+**Practical Applications:**
+- Real-world applications: Where could this be deployed? What problems does it solve?
+- Implementation challenges: What technical, computational, or practical barriers exist for deployment?
+
+**Academic Context:**
+- Related work analysis: How does this build on, differ from, or challenge existing literature?
+- Citation-worthy claims: Identify 3-5 key claims that would be worth citing in future work.
+
+**Communication & Framing:**
+- Research framing: Brainstorm 3-5 different ways to frame this research for different audiences (academic, industry, policy, public). Focus on clear, compelling narratives that highlight the core contribution and avoid confusing technical nuances. Consider how to present the key insight simply and memorably.
+
+CRITICAL REQUIREMENTS:
+- Apply PhD-level technical rigor in your assessment
+- Focus specifically on ML research with AI safety lens
+- Be precise about technical details and avoid generic commentary
+- Consider both immediate and long-term implications for AI development
+- Evaluate claims critically but fairly
+
+Provide your analysis in structured JSON format matching the ResearchAnalysisOutput schema:
+{{
+    "core_contribution": "...",
+    "methodology": "...",
+    "key_results": "...",
+    "technical_novelty": "...",
+    "safety_implications": "...",
+    "risk_assessment": "...",
+    "alignment_relevance": "...",
+    "experimental_rigor": "...",
+    "significance_rating": "...",
+    "future_directions": "...",
+    "real_world_applications": "...",
+    "implementation_challenges": "...",
+    "related_work_analysis": "...",
+    "citation_worthy_claims": ["...", "...", "..."],
+    "research_framing": ["...", "...", "..."]
+}}"""
+
+def _run_expert_analysis(pdf_data: dict, paper_title: str, authors: str) -> ResearchAnalysisOutput:
+    """
+    Run the PhD-level Claude analysis on the paper's main content, reusing a cached result for an identical prompt.
+    """
+    main_content = pdf_data['main_content']
+    
+    # Construct expert analysis prompt (using filtered main content), capped to keep the request bounded
+    if len(main_content) > _MAX_ANALYSIS_CHARS:
+        logger.warning(f"Truncating paper content for analysis: {len(main_content)} → {_MAX_ANALYSIS_CHARS} chars")
+        main_content = main_content[:_MAX_ANALYSIS_CHARS]
+    
+    expert_prompt = _EXPERT_PROMPT_TEMPLATE.format(
+        main_content=main_content,
+        paper_title=paper_title,
+        authors=authors,
+        pages=pdf_data['document_structure']['pages'],
+        total_images=pdf_data['visual_content']['total_images'],
+        total_drawings=pdf_data['visual_content']['total_drawings']
+    )
+
+    # Identical prompt (same capped paper content and metadata) + model -> reuse the earlier analysis
+    analysis_cache_path = _llm_cache_path('analysis', expert_prompt, _ANALYSIS_MODEL, '.json')
+    if analysis_cache_path.exists() and not _REFRESH_CACHE:
+        try:
+            cached_analysis = ResearchAnalysisOutput(**_load_json(analysis_cache_path.read_bytes()))
+            os.utime(analysis_cache_path)  # Mark as recently used so pruning keeps it
+            logger.info(f"Loaded cached Claude analysis from {analysis_cache_path}")
+            return cached_analysis
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable analysis cache {analysis_cache_path}: {e}")
+    
+    # Initialize Claude with PhD-level AI safety expertise
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+        except ImportError:
+            pass
+    
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not found in environment")
+    
+    from anthropic import Anthropic
+    client = Anthropic(api_key=api_key)
+    
+    logger.info("Analyzing research paper with Claude 4.1 Opus (PhD-level AI safety expertise)")
+    
+    try:
+        # Stream the response so the long Opus generation arrives incrementally instead of one blocking read
+        with client.messages.stream(
+            model=_ANALYSIS_MODEL,
+            max_tokens=4096,
+            messages=[{
+                "role": "user",
+                "content": expert_prompt
+            }]
+        ) as stream:
+            analysis_text = ''.join(stream.text_stream)
+        
+        logger.info(f"Claude analysis completed: {len(analysis_text)} characters")
+        
+        # Parse JSON response (first "{" through last "}")
+        json_match = _JSON_OBJECT_RE.search(analysis_text)
+        if json_match:
+            json_str = json_match.group(0)
+            
+            try:
+                # Parse directly when the JSON is well-formed; json_repair handles malformed output
+                try:
+                    analysis_data = _load_json(json_str)
+                except ValueError:
+                    analysis_data = json_repair(json_str, fallback_value={})
+                
+                if not analysis_data:
+                    raise ValueError("Failed to parse Claude analysis as JSON")
+                
+                # Validate and create ResearchAnalysisOutput
+                analysis = ResearchAnalysisOutput(**analysis_data)
+                
+                try:
+                    analysis_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    analysis_cache_path.write_bytes(_dump_json(analysis_data))
+                    _prune_cache(analysis_cache_path.parent, "analysis_*.json")
+                except Exception as e:
+                    logger.warning(f"Failed to write analysis cache {analysis_cache_path}: {e}")
+                
+                return analysis
+                
+            except Exception as e:
+                logger.error(f"Failed to create ResearchAnalysisOutput: {e}")
+                raise ValueError(f"Failed to parse Claude analysis: {e}")
+        else:
+            raise ValueError("No JSON structure found in Claude response")
+            
+    except Exception as e:
+        logger.error(f"Error during Claude analysis: {e}")
+        raise
+
 def analyze_research_paper(pdf_path: str, paper_title: str = None, authors: str = None) -> ResearchAnalysisOutput:
     """
     Comprehensive ML research paper analysis with figure extraction and structured output.
@@ -1570,56 +1999,51 @@ def analyze_research_paper(pdf_path: str, paper_title: str = None, authors: str
     logger.info(f"Starting comprehensive research paper analysis: {pdf_path}")
     
     # STEP 1: Extract comprehensive PDF data using PyMuPDF
+    # One document handle is shared by content and figure extraction (steps 1-2)
     logger.info("Extracting PDF metadata and content...")
-    pdf_data = _extract_pdf_metadata_and_content(pdf_path)
-    
-    # Determine paper title from metadata or extraction
-    if not paper_title:
-        paper_title = (pdf_data['pdf_metadata']['title'] or 
-                      pdf_data['extracted_from_first_page']['title_from_text'] or 
-                      Path(pdf_path).stem)
+    import fitz  # PyMuPDF
+    with fitz.open(pdf_path) as doc:
+        pdf_data = _extract_pdf_data_cached(doc, pdf_path)
+    
+        # Determine paper title from metadata or extraction
+        if not paper_title:
+            paper_title = (pdf_data['pdf_metadata']['title'] or 
+                          pdf_data['extracted_from_first_page']['title_from_text'] or 
+                          Path(pdf_path).stem)
                       
-    # Clean up existing output directory for fresh start
-    from far_comms.utils.project_paths import get_output_dir
-    
-    def sanitize_dirname(title: str) -> str:
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', title)
-        sanitized = re.sub(r'[^\w\s\-_\.]', '', sanitized)
-        sanitized = re.sub(r'\s+', '_', sanitized)
-        return sanitized.strip('_').strip('.')[:100]
-    
-    sanitized_title = sanitize_dirname(paper_title)
-    output_dir = get_output_dir() / "research" / sanitized_title
-    
-    if output_dir.exists():
-        logger.info(f"Removing existing output directory: {output_dir}")
-        shutil.rmtree(output_dir)
-    
-    logger.info(f"Creating fresh output directory: {output_dir}")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Determine authors from metadata or extraction  
-    if not authors:
-        authors = (pdf_data['pdf_metadata']['author'] or
-                  pdf_data['extracted_from_first_page']['authors_from_text'] or
-                  'Unknown authors')
-    
-    logger.info(f"Paper: {paper_title}")
-    logger.info(f"Authors: {authors}")
-    logger.info(f"Raw text: {pdf_data['raw_text_length']} chars from {pdf_data['document_structure']['pages']} pages")
-    logger.info(f"Visual content: {pdf_data['visual_content']['total_images']} images, {pdf_data['visual_content']['total_drawings']} drawings")
-    
-    # STEP 2: Extract figures from pages before references section
-    logger.info("Extracting figures before references section...")
-    references_page = _find_references_page(pdf_data['raw_text'])
-    max_figure_page = references_page if references_page > 0 else None
-    
-    figures_result = _extract_figures_from_pdf(pdf_path, paper_title, max_figure_page)
+        # Clean up existing output directory for fresh start
+        sanitized_title = _sanitize_dirname(paper_title)
+        output_dir = _research_root() / sanitized_title
+    
+        if output_dir.exists():
+            logger.info(f"Removing existing output directory: {output_dir}")
+            shutil.rmtree(output_dir)
+    
+        logger.info(f"Creating fresh output directory: {output_dir}")
+        output_dir.mkdir(parents=True, exist_ok=True)
+    
+        # Determine authors from metadata or extraction  
+        if not authors:
+            authors = (pdf_data['pdf_metadata']['author'] or
+                      pdf_data['extracted_from_first_page']['authors_from_text'] or
+                      'Unknown authors')
+    
+        logger.info(f"Paper: {paper_title}")
+        logger.info(f"Authors: {authors}")
+        logger.info(f"Raw text: {pdf_data['raw_text_length']} chars from {pdf_data['document_structure']['pages']} pages")
+        logger.info(f"Visual content: {pdf_data['visual_content']['total_images']} images, {pdf_data['visual_content']['total_drawings']} drawings")
+    
+        # STEP 2: Extract figures from pages before references section
+        logger.info("Extracting figures before references section...")
+        references_page = pdf_data['references_page']
+        max_figure_page = references_page if references_page > 0 else None
+    
+        figures_result = _extract_figures_from_pdf(doc, pdf_path, paper_title, max_figure_page)
     if figures_result['success']:
         logger.info(f"Extracted {figures_result['total_figures']} figures from {figures_result['pages_processed']} pages")
         if figures_result['figures_extracted']:
             sample_figures = figures_result['figures_extracted'][:3]  # Show first 3
-            logger.info(f"Sample figures: {[f['filename'] for f in sample_figures]}")
+            logger.info(f"Sample figures: {[f.filename for f in sample_figures]}")
     else:
         logger.warning(f"Figure extraction failed: {figures_result.get('error', 'Unknown error')}")
     
@@ -1633,8 +2057,7 @@ def analyze_research_paper(pdf_path: str, paper_title: str = None, authors: str
     
     # Ensure pdf.txt exists
     if not pdf_txt_path.exists():
-        with open(pdf_txt_path, 'w', encoding='utf-8') as f:
-            f.write(pdf_data['raw_text'])
+        pdf_txt_path.write_text(pdf_data['raw_text'], encoding='utf-8')
     
     # Ensure pdf.json exists (temporary minimal version for LLM processing)
     if not pdf_json_path.exists():
@@ -1642,8 +2065,7 @@ def analyze_research_paper(pdf_path: str, paper_title: str = None, authors: str
             'pdf_metadata': pdf_data.get('pdf_metadata', {}),
             'extracted_from_first_page': pdf_data.get('extracted_from_first_page', {})
         }
-        with open(pdf_json_path, 'w', encoding='utf-8') as f:
-            json.dump(temp_json, f, indent=2)
+        pdf_json_path.write_bytes(_dump_json(temp_json))
     
     # Ensure pdf.md exists (PyMuPDF4LLM output)
     if not pdf_md_path.exists():
@@ -1651,9 +2073,9 @@ def analyze_research_paper(pdf_path: str, paper_title: str = None, authors: str
         if PYMUPDF4LLM_AVAILABLE and pdf_path:
             logger.info("Generating pdf.md using PyMuPDF4LLM...")
             try:
+                import pymupdf4llm
                 md_text = pymupdf4llm.to_markdown(pdf_path)
-                with open(pdf_md_path, 'w', encoding='utf-8') as f:
-                    f.write(md_text)
+                pdf_md_path.write_text(md_text, encoding='utf-8')
                 logger.info(f"Saved PyMuPDF4LLM output to {pdf_md_path}")
             except Exception as e:
                 logger.warning(f"Failed to generate pdf.md: {e}")
@@ -1665,8 +2087,7 @@ def analyze_research_paper(pdf_path: str, paper_title: str = None, authors: str
     
     # Save coda.json metadata
     coda_json_path = output_dir / "coda.json"
-    with open(coda_json_path, 'w', encoding='utf-8') as f:
-        json.dump(coda_metadata, f, indent=2)
+    coda_json_path.write_bytes(_dump_json(coda_metadata))
     logger.info(f"Saved structured metadata to coda.json")
     
     filter_stats = {
@@ -1685,141 +2106,27 @@ def analyze_research_paper(pdf_path: str, paper_title: str = None, authors: str
     logger.info("Creating distilled bullet-point version with figures and header...")
     distilled_md = _create_distilled_version(cleaned_md, paper_title, figures_result, pdf_data['raw_text'], pdf_data)
     
-    # STEP 5: Save all 4 outputs (raw text, metadata JSON, cleaned MD, distilled MD)
+    # STEP 5: Save all 4 outputs (raw text, metadata JSON, cleaned MD, distilled MD) in the background
+    # so the disk writes overlap the Claude request in STEP 6
     logger.info("Saving research outputs...")
-    save_result = _save_research_outputs(pdf_path, paper_title, pdf_data, cleaned_md, distilled_md, filter_stats, figures_result)
-    
-    if save_result['success']:
-        logger.info(f"Saved outputs: {save_result['stats']}")
-    else:
-        logger.warning(f"Save partially failed: {save_result.get('error', 'Unknown error')}")
-    
-    # STEP 6: Run Claude analysis for technical insights (using filtered main content)
-    main_content = _filter_main_content(pdf_data['raw_text'])
-    
-    # Initialize Claude with PhD-level AI safety expertise
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-            api_key = os.getenv("ANTHROPIC_API_KEY")
-        except ImportError:
-            pass
-    
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY not found in environment")
-    
-    client = Anthropic(api_key=api_key)
-    
-    # Construct expert analysis prompt (using filtered main content)
-    expert_prompt = f"""You are a PhD researcher specializing in AI safety and alignment with deep technical expertise in machine learning. Analyze this research paper with the rigor and insight of a leading AI safety researcher.
-
-PAPER CONTENT:
-{main_content}
-
-PAPER METADATA:
-Title: {paper_title}
-Authors: {authors}
-Pages: {pdf_data['document_structure']['pages']}
-Visual Elements: {pdf_data['visual_content']['total_images']} images, {pdf_data['visual_content']['total_drawings']} drawings
-
-ANALYSIS INSTRUCTIONS:
-As an AI safety expert with PhD-level technical depth, provide a comprehensive analysis covering:
-
-**Technical Analysis:**
-- Core contribution: What is the main technical advancement? Be precise about the specific innovation.
-- Methodology: Describe the research approach, experimental design, and technical methods used.
-- Key results: Summarize the primary empirical findings, performance metrics, and quantitative results.
-- Technical novelty: What differentiates this from prior work? What technical barriers were overcome?
-
-**AI Safety & Alignment Context:**
-- Safety implications: How does this work impact AI safety? Consider both positive contributions and potential risks.
-- Risk assessment: What safety concerns does this raise? Consider capabilities, alignment, robustness, interpretability.
-- Alignment relevance: How does this relate to the broader AI alignment research agenda?
-
-**Research Quality & Significance:**
-- Experimental rigor: Evaluate the experimental design, baselines, statistical validity, and reproducibility.
-- Significance rating: Rate 1-10 with detailed rationale based on technical contribution, methodological rigor, and field impact.
-- Future directions: What are the most promising next steps this work enables?
-
-**Practical Applications:**
-- Real-world applications: Where could this be deployed? What problems does it solve?
-- Implementation challenges: What technical, computational, or practical barriers exist for deployment?
-
-**Academic Context:**
-- Related work analysis: How does this build on, differ from, or challenge existing literature?
-- Citation-worthy claims: Identify 3-5 key claims that would be worth citing in future work.
-
-**Communication & Framing:**
-- Research framing: Brainstorm 3-5 different ways to frame this research for different audiences (academic, industry, policy, public). Focus on clear, compelling narratives that highlight the core contribution and avoid confusing technical nuances. Consider how to present the key insight simply and memorably.
-
-CRITICAL REQUIREMENTS:
-- Apply PhD-level technical rigor in your assessment
-- Focus specifically on ML research with AI safety lens
-- Be precise about technical details and avoid generic commentary
-- Consider both immediate and long-term implications for AI development
-- Evaluate claims critically but fairly
-
-Provide your analysis in structured JSON format matching the ResearchAnalysisOutput schema:
-{{
-    "core_contribution": "...",
-    "methodology": "...",
-    "key_results": "...",
-    "technical_novelty": "...",
-    "safety_implications": "...",
-    "risk_assessment": "...",
-    "alignment_relevance": "...",
-    "experimental_rigor": "...",
-    "significance_rating": "...",
-    "future_directions": "...",
-    "real_world_applications": "...",
-    "implementation_challenges": "...",
-    "related_work_analysis": "...",
-    "citation_worthy_claims": ["...", "...", "..."],
-    "research_framing": ["...", "...", "..."]
-}}"""
-
-    logger.info("Analyzing research paper with Claude 4.1 Opus (PhD-level AI safety expertise)")
-    
-    try:
-        response = client.messages.create(
-            model="claude-opus-4-1-20250805",  # Use Opus 4.1 for PhD-level technical analysis
-            max_tokens=4096,
-            messages=[{
-                "role": "user",
-                "content": expert_prompt
-            }]
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        save_future = executor.submit(
+            _save_research_outputs, pdf_path, paper_title, pdf_data, cleaned_md, distilled_md, filter_stats, figures_result
         )
-        
-        analysis_text = response.content[0].text
-        logger.info(f"Claude analysis completed: {len(analysis_text)} characters")
-        
-        # Parse JSON response
-        if "{" in analysis_text and "}" in analysis_text:
-            json_start = analysis_text.find("{")
-            json_end = analysis_text.rfind("}") + 1
-            json_str = analysis_text[json_start:json_end]
-            
+        try:
+            # STEP 6: Run Claude analysis for technical insights (using filtered main content)
+            return _run_expert_analysis(pdf_data, paper_title, authors)
+        finally:
+            # A save failure is logged, never allowed to replace the analysis result or its exception
             try:
-                # Use json_repair for robust JSON parsing
-                analysis_data = json_repair(json_str, fallback_value={})
-                
-                if not analysis_data:
-                    raise ValueError("Failed to parse Claude analysis as JSON")
-                
-                # Validate and create ResearchAnalysisOutput
-                return ResearchAnalysisOutput(**analysis_data)
-                
+                save_result = save_future.result()
+                if save_result['success']:
+                    logger.info(f"Saved outputs: {save_result['stats']}")
+                else:
+                    logger.warning(f"Save partially failed: {save_result.get('error', 'Unknown error')}")
             except Exception as e:
-                logger.error(f"Failed to create ResearchAnalysisOutput: {e}")
-                raise ValueError(f"Failed to parse Claude analysis: {e}")
-        else:
-            raise ValueError("No JSON structure found in Claude response")
-            
-    except Exception as e:
-        logger.error(f"Error during Claude analysis: {e}")
-        raise
+                logger.error(f"Failed to save research outputs: {e}")
 
 
 def main():
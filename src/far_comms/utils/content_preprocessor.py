@@ -3,6 +3,9 @@
 import logging
 import glob
 import os
+import shutil
+import threading
+import time
 import base64
 from pathlib import Path
 from langchain_community.document_loaders import AssemblyAIAudioTranscriptLoader, PyPDFLoader
@@ -10,6 +13,88 @@ from langchain_community.document_loaders.assemblyai import TranscriptFormat
 
 logger = logging.getLogger(__name__)
 
+def _throttled_progress_hook(interval: float = 1.0):
+    """Build a yt-dlp progress hook that logs at most once per interval seconds"""
+    last_ts = [0.0]
+    
+    def hook(d: dict):
+        if d.get('status') == 'finished':
+            logger.info(f"Download completed: {d.get('filename', '')}")
+            return
+        now = time.monotonic()
+        if d.get('status') == 'downloading' and now - last_ts[0] >= interval:
+            last_ts[0] = now
+            logger.info(f"Downloading: {d.get('_percent_str', '').strip()} at {d.get('_speed_str', '').strip()}")
+    
+    return hook
+
+
+def _concurrent_fragments_setting(default: int = 4) -> int:
+    """Read YTDLP_CONCURRENT_FRAGMENTS, falling back to the default on a missing or invalid value"""
+    value = os.getenv('YTDLP_CONCURRENT_FRAGMENTS')
+    if value is None:
+        return default
+    try:
+        fragments = int(value)
+    except ValueError:
+        fragments = 0
+    if fragments < 1:
+        logger.warning(f"Invalid YTDLP_CONCURRENT_FRAGMENTS={value!r}, using {default}")
+        return default
+    return fragments
+
+
+# yt-dlp options shared by every YouTube audio download (per-call values are layered on top)
+_BASE_YDL_OPTS = {
+    # Keep the native m4a/AAC stream - AssemblyAI accepts it, so no ffmpeg re-encode.
+    # Prefer itag 140 (single-file m4a) over fragmented DASH to avoid per-fragment round-trips;
+    # a low-res muxed stream is the last resort for videos with no separate audio track
+    'format': '140/bestaudio[ext=m4a][protocol^=https]/bestaudio/best[height<=480]',
+    'allowed_extractors': ['youtube'],
+    'extract_flat': False,
+    'ignoreerrors': True,
+    # Silence per-fragment console output; progress goes through the throttled hook instead
+    'quiet': True,
+    'no_warnings': True,
+    # Warnings (format fallbacks, throttling) and errors are still reported, via logging
+    'logger': logger,
+    'noprogress': True,
+    'embed_subs': False,
+    'writesubtitles': False,
+    'writeautomaticsub': False,
+    # Anti-bot measures
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'referer': 'https://www.youtube.com/',
+    'buffersize': 1048576,  # 1 MiB download buffer -> fewer write() syscalls
+    'retries': 3,
+    'fragment_retries': 10,
+    'skip_unavailable_fragments': True,
+    # Fetch DASH/HLS fragments in parallel, backing off only on retries
+    'concurrent_fragment_downloads': _concurrent_fragments_setting(),
+    'retry_sleep_functions': {
+        'http': lambda n: min(4 * 2 ** n, 60),
+        'fragment': lambda n: min(2 ** n, 30),
+    },
+    # Cap threads for any ffmpeg fixup yt-dlp still runs (e.g. DASH m4a container fix)
+    'postprocessor_args': {'ffmpeg': ['-threads', '2']},
+}
+
+# Use aria2c for multi-connection range fetching when installed
+if shutil.which('aria2c'):
+    _BASE_YDL_OPTS['external_downloader'] = 'aria2c'
+    _BASE_YDL_OPTS['external_downloader_args'] = {
+        'aria2c': ['-x', '16', '-s', '16', '-k', '1M', '--file-allocation=none', '--console-log-level=warn']
+    }
+
+_ANTI_BOT_YDL_OPTS = {
+    'sleep_interval': 1,
+    'max_sleep_interval': 5,
+    'sleep_interval_subtitles': 1,
+}
+
+# With concurrent fragment downloads every thread buffers a chunk, so chunks are capped here to bound memory
+_CONCURRENT_HTTP_CHUNK_SIZE = 10485760  # 10 MiB
+
 
 def _decode_qr_codes_from_image(img_data: bytes) -> list:
     """
@@ -492,8 +577,49 @@ def find_video(speaker_name: str) -> str:
     return best_match if best_score > 0 else None
 
 
-def extract_youtube(youtube_url: str) -> dict:
-    """Extract transcript from YouTube using AssemblyAI with yt-dlp fallback"""
+def _new_ydl(http_chunk_size: int, anti_bot: bool):
+    """
+    Build a YoutubeDL instance with its own progress hook.
+    
+    Callers own the instance and close it (use it as a context manager).
+    Reusing one across downloads keeps its HTTP opener and cookie jar alive,
+    so connections to YouTube are not re-established per video.
+    """
+    import yt_dlp
+    
+    if _BASE_YDL_OPTS['concurrent_fragment_downloads'] > 1:
+        http_chunk_size = min(http_chunk_size, _CONCURRENT_HTTP_CHUNK_SIZE)
+    
+    ydl_opts = {
+        **_BASE_YDL_OPTS,
+        'outtmpl': 'audio.%(ext)s',
+        'http_chunk_size': http_chunk_size,
+        'progress_hooks': [_throttled_progress_hook()],
+    }
+    
+    # Only pace every request when YouTube is actually throttling us
+    if anti_bot:
+        ydl_opts.update(_ANTI_BOT_YDL_OPTS)
+    
+    return yt_dlp.YoutubeDL(ydl_opts)
+
+
+def extract_youtube(youtube_url: str, http_chunk_size: int = 10485760, anti_bot: bool = False, get_ydl=None) -> dict:
+    """
+    Extract transcript from YouTube using AssemblyAI with yt-dlp fallback.
+    
+    Args:
+        youtube_url: YouTube video URL
+        http_chunk_size: Byte size of each HTTP range request in the yt-dlp fallback
+            (default 10 MiB, which is also the cap while concurrent fragment downloads are
+            enabled - larger values only apply with YTDLP_CONCURRENT_FRAGMENTS=1;
+            0 falls back to the chunk size the YouTube extractor sets)
+        anti_bot: Sleep between yt-dlp requests to avoid rate limiting (off by default;
+            retries still back off exponentially)
+        get_ydl: Optional callable returning a YoutubeDL from _new_ydl to reuse for the
+            fallback download (extract_youtube_batch passes one per worker thread);
+            by default a fresh instance is opened and closed for this call
+    """
     try:
         # First try direct URL with AssemblyAI
         loader = AssemblyAIAudioTranscriptLoader(
@@ -519,34 +645,15 @@ def extract_youtube(youtube_url: str) -> dict:
         # If we get HTML/text error, try yt-dlp download first
         if "text/html" in error_str or "HTML document" in error_str:
             try:
-                import yt_dlp
                 import tempfile
                 import os
                 
+                from contextlib import nullcontext
+                
                 with tempfile.TemporaryDirectory() as temp_dir:
-                    audio_path = os.path.join(temp_dir, "audio.%(ext)s")
-                    
-                    ydl_opts = {
-                        'format': 'bestaudio[ext=m4a]/bestaudio[ext=mp3]/bestaudio/best[height<=480]',
-                        'outtmpl': audio_path,
-                        'extract_flat': False,
-                        'ignoreerrors': True,
-                        'no_warnings': False,
-                        'extractaudio': True,
-                        'audioformat': 'mp3',
-                        'embed_subs': False,
-                        'writesubtitles': False,
-                        'writeautomaticsub': False,
-                        # Anti-bot measures
-                        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                        'referer': 'https://www.youtube.com/',
-                        'http_chunk_size': 10485760,
-                        'retries': 3,
-                        'fragment_retries': 3,
-                        'skip_unavailable_fragments': True,
-                    }
-                    
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    with (nullcontext(get_ydl()) if get_ydl else _new_ydl(http_chunk_size, anti_bot)) as ydl:
+                        # Output directory is set per call; the instance is never shared across threads
+                        ydl.params['paths'] = {'home': temp_dir}
                         ydl.download([youtube_url])
                     
                     # Find the downloaded file
@@ -582,6 +689,48 @@ def extract_youtube(youtube_url: str) -> dict:
             return {"success": False, "error": error_str}
 
 
+def extract_youtube_batch(youtube_urls: list, max_workers: int = 4, http_chunk_size: int = 10485760, anti_bot: bool = False) -> list:
+    """
+    Extract transcripts for several YouTube URLs concurrently.
+    
+    Each URL runs through extract_youtube in a worker thread so network stalls
+    on one video overlap with work on the others. Each worker thread lazily opens
+    one YoutubeDL for its yt-dlp fallbacks; all are closed when the batch ends.
+    
+    Args:
+        youtube_urls: List of YouTube video URLs
+        max_workers: Maximum number of videos processed at once
+        http_chunk_size: Passed through to extract_youtube
+        anti_bot: Passed through to extract_youtube (parallel batches are the most likely to be throttled)
+        
+    Returns:
+        List of extract_youtube result dicts, in the same order as youtube_urls
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from contextlib import ExitStack
+    from functools import partial
+    
+    if not youtube_urls:
+        return []
+    
+    thread_ydl = threading.local()
+    stack_lock = threading.Lock()
+    
+    with ExitStack() as stack:
+        def get_ydl():
+            ydl = getattr(thread_ydl, 'ydl', None)
+            if ydl is None:
+                ydl = _new_ydl(http_chunk_size, anti_bot)
+                with stack_lock:
+                    stack.enter_context(ydl)
+                thread_ydl.ydl = ydl
+            return ydl
+        
+        extract = partial(extract_youtube, http_chunk_size=http_chunk_size, anti_bot=anti_bot, get_ydl=get_ydl)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(youtube_urls))) as executor:
+            return list(executor.map(extract, youtube_urls))
+
+
 def extract_video(video_path: str) -> dict:
     """Extract transcript from local video file using AssemblyAI"""
     try:
@@ -2,11 +2,22 @@
 
 import json
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _repair_lib():
+    """Import the json-repair library on first use; None if it isn't installed"""
+    try:
+        import json_repair as repair_lib
+        return repair_lib
+    except ImportError:
+        return None
+
+
 def json_repair(result_text: str, max_attempts: int = 3, fallback_value: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Iteratively repair malformed JSON using json-repair library and Claude Haiku until valid.
@@ -88,15 +99,18 @@ def json_repair(result_text: str, max_attempts: int = 3, fallback_value: Optiona
         except json.JSONDecodeError as e:
             logger.debug(f"Attempt {attempt + 1} failed: {e}")
             
-            # Try json-repair library first
-            try:
-                import json_repair as repair_lib
-                repaired_text = repair_lib.repair_json(current_text)
-                parsed = json.loads(repaired_text)
-                logger.debug(f"Successfully repaired JSON with json-repair on attempt {attempt + 1}")
-                return parsed
-            except (ImportError, Exception) as repair_error:
-                logger.debug(f"json-repair failed on attempt {attempt + 1}: {repair_error}")
+            # Try json-repair library first (imported once, on the first parse failure)
+            repair_lib = _repair_lib()
+            if repair_lib is None:
+                logger.debug("json-repair not installed, skipping library repair")
+            else:
+                try:
+                    repaired_text = repair_lib.repair_json(current_text)
+                    parsed = json.loads(repaired_text)
+                    logger.debug(f"Successfully repaired JSON with json-repair on attempt {attempt + 1}")
+                    return parsed
+                except Exception as repair_error:
+                    logger.debug(f"json-repair failed on attempt {attempt + 1}: {repair_error}")
             
             # If json-repair failed or isn't available, try Haiku cleanup
             if attempt < max_attempts - 1:  # Don't use Haiku on the last attempt
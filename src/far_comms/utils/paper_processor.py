@@ -12,6 +12,7 @@ import os
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import fitz  # PyMuPDF
+from far_comms.handlers.analyze_research import _FIG_OR_TABLE_RE
 
 logger = logging.getLogger(__name__)
 
@@ -191,43 +192,15 @@ def _filter_main_content(text_content: str) -> str:
     # Return filtered content
     main_content = '\n'.join(lines[:end_idx])
     
-    original_words = len(text_content.split())
-    filtered_words = len(main_content.split())
-    logger.info(f"Filtered content: {original_words} → {filtered_words} words ({filtered_words/original_words*100:.1f}% retained)")
+    retained = len(main_content) / len(text_content) * 100 if text_content else 0
+    logger.info(f"Filtered content: {len(text_content)} → {len(main_content)} chars ({retained:.1f}% retained)")
     
     return main_content
 
 
 def _has_figures_or_tables(text_content: str) -> bool:
     """Check if the paper contains figure or table references that would benefit from visual analysis"""
-    figure_patterns = [
-        r'\bfig\.?\s*\d+',
-        r'\bfigure\s+\d+',
-        r'\btable\s+\d+',
-        r'\btab\.?\s*\d+',
-        r'\bplot\s+\d+',
-        r'\bgraph\s+\d+',
-        r'\bchart\s+\d+',
-        r'\bdiagram\s+\d+',
-        r'see\s+figure',
-        r'shown\s+in\s+figure',
-        r'as\s+illustrated',
-        r'algorithm\s+\d+'
-    ]
-    
-    text_lower = text_content.lower()
-    
-    for pattern in figure_patterns:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return True
-    
-    # Also check for common visual indicators
-    visual_keywords = ['algorithm', 'flowchart', 'visualization', 'plot', 'graph', 'chart']
-    for keyword in visual_keywords:
-        if keyword in text_lower:
-            return True
-    
-    return False
+    return _FIG_OR_TABLE_RE.search(text_content) is not None
 
 
 if __name__ == "__main__":
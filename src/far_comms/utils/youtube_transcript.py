@@ -83,13 +83,13 @@ def download_youtube_audio(youtube_url: str, temp_dir: str = None) -> Optional[s
         output_path = os.path.join(temp_dir, f"{video_id}.%(ext)s")
         
         ydl_opts = {
-            'format': 'bestaudio/best',  # Download best audio quality
+            'format': '140/bestaudio[ext=m4a][protocol^=https]/bestaudio/best',  # Single-file m4a, no re-encode
+            'allowed_extractors': ['youtube'],
             'outtmpl': output_path,
-            'extractaudio': True,
-            'audioformat': 'mp3',
             'noplaylist': True,
             'quiet': True,  # Suppress output
             'no_warnings': True,
+            'logger': logger,  # yt-dlp warnings and errors go to logging instead of being dropped
         }
         
         logger.info(f"Downloading audio from YouTube video: {video_id}")